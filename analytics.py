@@ -0,0 +1,109 @@
+# analytics.py
+import bisect
+import datetime
+import heapq
+from collections import Counter
+
+from streak import COURSE_KEY, EPOCH, epoch_days, parse_key
+
+# Training rollups for one history store, kept materialized next to its rows:
+#   weekly : Monday (epoch day) -> completed calendar days that week
+#   moods  : (phase, mood) -> logs
+#   course : (week, "Day N") -> completed course logs
+#   dates  : every history key, sorted (History tab pages are slices of it)
+# rebuild() derives them in bulk (NumPy for the date group-bys) when a store loads; update()
+# applies one upsert, so logging a workout never rescans the history.
+
+
+def week_start(day):
+    """Monday on or before epoch `day` (1970-01-01 was a Thursday)."""
+    return day - (day + 3) % 7
+
+
+def _day(epoch_day):
+    return EPOCH + datetime.timedelta(days=epoch_day)
+
+
+class Rollups:
+    def __init__(self, rows=None):
+        self.rebuild(rows or {})
+
+    def rebuild(self, rows):
+        self.dates = sorted(rows)
+        self.weekly, self.moods, self.course = {}, Counter(), Counter()
+        if not rows:
+            return
+        import numpy as np  # only needed for full rebuilds, kept off the cold-start path
+
+        done = [key for key, row in rows.items() if row[2] == "Yes"]
+        course = [key for key in done if key.startswith("Week ")]
+        if len(course) < len(done):
+            # Group-by week: sort the Monday of every completed day, count each run of equal values
+            weeks = epoch_days([key for key in done if not key.startswith("Week ")] if course else done)
+            weeks = np.sort(weeks - (weeks + 3) % 7)
+            if weeks.size:
+                firsts = np.flatnonzero(np.concatenate(([True], weeks[1:] != weeks[:-1])))
+                counts = np.diff(np.append(firsts, weeks.size))
+                self.weekly = dict(zip(weeks[firsts].tolist(), counts.tolist()))
+        for m in filter(None, map(COURSE_KEY.match, course)):
+            self.course[int(m.group(1)), m.group(2)] += 1
+        # Rows share a handful of (Phase, Mood, Completed) tuples: count those, then fold
+        for (phase, mood, _), n in Counter(rows.values()).items():
+            self.moods[phase, mood] += n
+
+    def _apply(self, key, row, sign):
+        phase, mood, completed = row
+        self.moods[phase, mood] += sign
+        if completed != "Yes":
+            return
+        parsed = parse_key(key)
+        if parsed is None:
+            return
+        if parsed[0] == "course":
+            self.course[parsed[1]] += sign
+        else:
+            week = week_start(parsed[1])
+            self.weekly[week] = self.weekly.get(week, 0) + sign
+
+    def update(self, key, old, new):
+        """Folds one upsert of `key` (old row, or None when the key is new) into the rollups."""
+        if old is None:
+            bisect.insort(self.dates, key)
+        else:
+            self._apply(key, old, -1)
+        self._apply(key, new, +1)
+
+    # --- read side (all bounded by the number of rows shown, not the history) ---
+    def page(self, page, page_size):
+        """Keys on 1-based `page`, newest first, and the page count."""
+        pages = max(1, -(-len(self.dates) // page_size))
+        page = min(max(page, 1), pages)
+        end = len(self.dates) - (page - 1) * page_size
+        return self.dates[max(0, end - page_size):end][::-1], pages
+
+    def weekly_adherence(self, weeks=12, today=None):
+        """[(monday, days_done)] for the last `weeks` weeks, oldest first."""
+        this_week = week_start(((today or datetime.date.today()) - EPOCH).days)
+        return [(_day(w), self.weekly.get(w, 0)) for w in range(this_week - 7 * (weeks - 1), this_week + 1, 7)]
+
+    def mood_by_phase(self):
+        """{phase: {mood: logs}}"""
+        out = {}
+        for (phase, mood), n in self.moods.items():
+            if n:
+                out.setdefault(phase, {})[mood] = n
+        return out
+
+    def course_progress(self, weeks, days):
+        """[(week, days_done, days_planned)] for the given course weeks and days."""
+        return [(w, sum(1 for d in days if self.course.get((w, d))), len(days)) for w in weeks]
+
+
+def _run_rows(runs):
+    return [(_day(s), _day(e), e - s + 1) for s, e in runs]
+
+
+def streak_history(tracker, n=5):
+    """(longest, most recent) streaks of a StreakTracker, each [(first_day, last_day, days)]."""
+    runs = tracker.runs()
+    return _run_rows(heapq.nlargest(n, runs, key=lambda r: r[1] - r[0])), _run_rows(runs[-n:][::-1])
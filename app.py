@@ -1,111 +1,244 @@
 # app.py
 import streamlit as st
+import analytics
 import datetime
-import pandas as pd
 import os
-import data # Importing the expanded 12-week data file
+import history
+import metrics
+import plans
+import render
+import search
+import tempfile
+import ticks
 
 # ==========================================
 # 1. CONFIGURATION & HISTORY LOGIC
 # ==========================================
 st.set_page_config(page_title="Bulletproof Athlete 12-Week", page_icon="🛡️", layout="wide")
 
-HISTORY_FILE = "workout_history.csv"
+HISTORY_FILE = "workout_history.csv"  # default athlete (keeps single-user deployments working)
+HISTORY_DIR = "athletes"  # one partition per named athlete
+HISTORY_PAGE_ROWS = 50  # rows per page of the History table
 
-def load_history():
-    if not os.path.exists(HISTORY_FILE):
-        return pd.DataFrame(columns=["Date", "Phase", "Mood", "Completed"])
-    return pd.read_csv(HISTORY_FILE)
+def history_store(athlete):
+    if history.athlete_slug(athlete) == "default":
+        return history.get_store(HISTORY_FILE)
+    return history.get_store(history.athlete_path(HISTORY_DIR, athlete))
 
-def save_history(date, phase, mood, completed):
-    df = load_history()
-    df["Date"] = df["Date"].astype(str)
-    if date in df["Date"].values:
-        df.loc[df["Date"] == date, ["Phase", "Mood", "Completed"]] = [phase, mood, completed]
-    else:
-        new_row = pd.DataFrame({"Date": [date], "Phase": [phase], "Mood": [mood], "Completed": [completed]})
-        df = pd.concat([df, new_row], ignore_index=True)
-    df.to_csv(HISTORY_FILE, index=False)
-
-def clear_history():
-    if os.path.exists(HISTORY_FILE):
-        os.remove(HISTORY_FILE)
-        return True
-    return False
-
-def get_streak(df):
-    if df.empty: return 0
-    df["Date"] = pd.to_datetime(df["Date"])
-    df = df.sort_values("Date", ascending=False)
-    today = pd.to_datetime(datetime.date.today())
-    is_today_logged = not df[df["Date"] == today].empty
-    streak = 0
-    current_date = today if is_today_logged else today - datetime.timedelta(days=1)
-    for date in df["Date"]:
-        if date == current_date:
-            streak += 1
-            current_date -= datetime.timedelta(days=1)
-        elif date > current_date: continue
-        else: break
-    return streak
-
-def get_youtube_link(name):
-    clean_name = name.split("(")[0].strip()
-    return f"https://www.youtube.com/results?search_query={clean_name.replace(' ', '+')}+exercise+form"
+@metrics.timed("history_page")
+def history_page(athlete, page, page_size=HISTORY_PAGE_ROWS):
+    # Sliced from the store's sorted key index: a page costs page_size rows, not a sort
+    store = history_store(athlete)
+    store.refresh()
+    return store.page(page, page_size)
+
+@metrics.timed("get_analytics")
+def get_analytics(athlete):
+    # Rollups are maintained by the store on every save; this only reads them
+    store = history_store(athlete)
+    store.refresh()
+    rollups = store.rollups
+    course = rollups.course_progress(plans.course_weeks(), plans.COURSE_DAYS)
+    return rollups.weekly_adherence(), rollups.mood_by_phase(), course, analytics.streak_history(store.streaks)
+
+@metrics.timed("save_history")
+def save_history(athlete, date, phase, mood, completed):
+    # O(1) journal append + in-memory upsert; compaction folds the journal in the background
+    history_store(athlete).upsert(date, phase, mood, completed)
+
+@metrics.timed("import_history")
+def import_history(athlete, f, fmt, progress=None):
+    # Streamed in chunks: one journal fsync per chunk, streaks/rollups rebuilt once at the end
+    return history.import_history(history_store(athlete), f, fmt, progress)
+
+def export_history(athlete, fmt):
+    # history.export_history encodes one chunk at a time; spool the blocks to disk so the
+    # only full copy in memory is the one Streamlit's media file manager keeps for the download
+    f = tempfile.TemporaryFile(buffering=0)  # raw file: download_button reads io.RawIOBase
+    for block in history.export_history(history_store(athlete), fmt):
+        f.write(block)
+    f.seek(0)
+    return f
+
+def clear_history(athlete):
+    return history_store(athlete).clear()
+
+@metrics.timed("get_streak")
+def get_streak(athlete):
+    # Maintained incrementally by the store; "Week N Day M" course keys never count
+    store = history_store(athlete)
+    store.refresh()
+    return store.streaks.current(), store.streaks.longest
 
 # ==========================================
 # 2. STYLING
 # ==========================================
-st.markdown("""
-<style>
-    .banner { padding: 20px; border-radius: 12px; color: white; margin-bottom: 25px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
-    /* Life Protocol Colors */
-    .repair { background: linear-gradient(135deg, #F57C00, #E65100); }
-    .recovery { background: linear-gradient(135deg, #607D8B, #455A64); }
-    /* 12-Week Course Colors */
-    .phase1 { background: linear-gradient(135deg, #FF9800, #F57C00); } /* Orange - Stability */
-    .phase2 { background: linear-gradient(135deg, #4CAF50, #2E7D32); } /* Green - Strength */
-    .phase3 { background: linear-gradient(135deg, #2196F3, #1565C0); } /* Blue - Power */
-    
-    .alt-text { color: #d32f2f !important; font-size: 0.9em; font-weight: bold; display: block; margin-top: 5px; }
-    .tempo-tag { background-color: #e3f2fd; color: #1565c0 !important; padding: 2px 8px; border-radius: 4px; font-size: 0.85em; font-weight: bold; }
-    
-    /* Bible Card */
-    .bible-card { background-color: #f1f8e9; color: #1a1a1a !important; padding: 15px; border-radius: 10px; border-left: 5px solid #558b2f; margin-bottom: 10px; }
-    .bible-card h4 { color: #2e7d32 !important; margin: 0 0 5px 0; }
-    .bible-card p { color: #1a1a1a !important; margin: 5px 0; }
-    
-    /* Core Box */
-    .core-box { background-color: #e9ecef; color: #1a1a1a !important; border-left: 5px solid #343a40; padding: 15px; border-radius: 0 8px 8px 0; margin-top: 20px; }
-    .core-box h4 { color: #1a1a1a !important; margin: 0 0 10px 0; }
-    a { text-decoration: none; font-weight: bold; color: #0288D1 !important; }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{render.CSS}</style>", unsafe_allow_html=True)
 
 # ==========================================
 # 3. LOGIC FUNCTIONS
 # ==========================================
-def get_daily_plan(data_source, day_name, is_home):
-    gym_plan = data_source["Routine"].get(day_name, {"Focus": "Rest", "Type": "Recovery", "Category": "Mobility", "Home_Map": "Mobility", "Exercises": [{"name": "Walk", "sets": "30m", "tempo": "-", "alt": "-"}], "Core": []})
-    cat = gym_plan.get("Category", "Mobility")
-    warmup = data.WARMUPS.get(cat, data.WARMUPS["Mobility"])
-    cooldown = data.COOLDOWNS.get(cat, data.COOLDOWNS["Mobility"])
-
-    if is_home and gym_plan["Type"] == "Gym":
-        home_key = gym_plan.get("Home_Map", "Mobility")
-        home_exs = data.HOME_REPAIR.get(home_key, data.HOME_REPAIR["Monday"]) 
-        return {"Focus": f"Home Repair: {gym_plan['Focus']}", "Type": "Home", "Exercises": home_exs, "Core": gym_plan.get("Core", []), "Warmup": warmup, "Cooldown": cooldown}
-    
-    return {**gym_plan, "Warmup": warmup, "Cooldown": cooldown}
+@metrics.timed("get_daily_plan")
+def get_daily_plan(day_name, is_home, override=False):
+    # Precompiled by plans.py on first use; a rerun only does the lookup
+    return plans.life_plan(day_name, is_home, override)
 
+@metrics.timed("ai_coach")
 def ai_coach(day_count, mode, mood):
     if mood == "Injured / Pain": return "🚨 **INJURY:** Gym Cancelled. Rehab Loaded.", True
     if mood == "Tired / Low Energy": return "📉 **ADJUST:** Reduce weight 20%.", False
     return "✅ **GO MODE:** Focus on structure.", False
 
 # ==========================================
-# 4. MAIN UI
+# 4. FRAGMENTS (rerun on their own widgets only)
 # ==========================================
+SUPPLEMENTS = {
+    "Morning": ["L-Carnitine", "NMN"],
+    "Breakfast": ["Ubiquinol + Omega3", "B12 + C", "Vit E", "Vit D3 (Sundays Only)"],
+    "Night": ["Magnesium", "Zinc"],
+}
+
+def get_ticks(athlete):
+    return ticks.get_ticks(history_store(athlete).path + ".ticks.json")
+
+def _save_tick(saved, day, key, widget_key):
+    saved.set(day, key, st.session_state[widget_key])
+
+def persisted(athlete, day, key, default):
+    # Widget kwargs: restore today's saved value once per session, save on every change
+    saved = get_ticks(athlete)
+    widget_key = f"{history.athlete_slug(athlete)}_{day}_{key}"
+    if widget_key not in st.session_state:
+        st.session_state[widget_key] = saved.get(day, key, default)
+    return {"key": widget_key, "on_change": _save_tick, "args": (saved, day, key, widget_key)}
+
+@st.fragment
+@metrics.timed("fragment.daily_stack", run=True)
+def daily_stack(athlete, day):
+    for slot, items in SUPPLEMENTS.items():
+        with st.expander(slot):
+            for item in items: st.checkbox(item, **persisted(athlete, day, f"supp_{item}", False))
+
+@st.fragment
+@metrics.timed("fragment.routine_checklist", run=True)
+def routine_checklist(plan, plan_key, athlete, day, heading=None):
+    # Each section is one markdown payload + one checklist widget
+    if plan.warmup:
+        with st.expander("🔥 Warmup"):
+            st.markdown(render.item_list_html(plan.warmup), unsafe_allow_html=True)
+            st.multiselect("Done", render.item_labels(plan.warmup), **persisted(athlete, day, f"wu_{plan_key}", []))
+    
+    if heading: st.subheader(heading)
+    st.markdown(render.routine_html(plan.exercises, plan.type == "Gym"), unsafe_allow_html=True)
+    st.multiselect("Done", render.exercise_labels(plan.exercises), **persisted(athlete, day, f"ex_{plan_key}", []))
+    
+    if plan.core:
+        st.markdown(render.item_list_html(plan.core, "sets", "🧱 Core Finisher"), unsafe_allow_html=True)
+        st.multiselect("Done", render.item_labels(plan.core, "sets"), **persisted(athlete, day, f"core_{plan_key}", []))
+    
+    if plan.cooldown:
+         st.subheader("❄️ Cooldown")
+         st.markdown(render.item_list_html(plan.cooldown), unsafe_allow_html=True)
+         st.multiselect("Done", render.item_labels(plan.cooldown), **persisted(athlete, day, f"cd_{plan_key}", []))
+
+@st.fragment
+@metrics.timed("fragment.bible_search", run=True)
+def bible_search():
+    st.header("📖 Exercise Encyclopedia")
+    query = st.text_input("🔍 Search", "", help="Typos are fine. Scope a word with name:, muscle:, stretch:, cue: or source: (e.g. muscle:adductors)")
+    results = search.get_index().search(query)
+    # Paginated: only one page of cards is ever sent; a new query starts at page 1
+    if st.session_state.get("bible_query") != query:
+        st.session_state["bible_query"] = query
+        st.session_state["bible_page"] = 1
+    cards, pages = render.bible_page(results, st.session_state.get("bible_page", 1))
+    st.session_state["bible_page"] = min(st.session_state.get("bible_page", 1), pages)
+    st.caption(f"{len(results)} exercises")
+    st.markdown(cards, unsafe_allow_html=True)
+    if pages > 1:
+        st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, key="bible_page")
+
+def training_analytics(athlete):
+    weekly, moods, course, (longest, recent) = get_analytics(athlete)
+    st.header("📈 Analytics")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Weekly Adherence")
+        st.markdown(render.table_html(["Week of", "Days", ""], [(monday, f"{n}/7", "█" * n + "░" * max(0, 7 - n)) for monday, n in reversed(weekly)]), unsafe_allow_html=True)
+    with col2:
+        st.subheader("12-Week Progress")
+        done, planned = sum(c[1] for c in course), sum(c[2] for c in course)
+        st.progress(done / planned if planned else 0.0, text=f"{done} of {planned} sessions")
+        st.markdown(render.table_html(["Week", "Days"], [(w, "✅" * n + "⬜" * (p - n)) for w, n, p in course]), unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Mood by Phase")
+        mood_names = sorted({m for per_phase in moods.values() for m in per_phase})
+        st.markdown(render.table_html(["Phase", *mood_names], [(phase, *(per_phase.get(m, 0) for m in mood_names)) for phase, per_phase in sorted(moods.items())]), unsafe_allow_html=True)
+    with col2:
+        st.subheader("Streaks")
+        st.markdown(render.table_html(["Longest", "From", "To"], [(f"{n} days", a, b) for a, b, n in longest]), unsafe_allow_html=True)
+        st.markdown(render.table_html(["Recent", "From", "To"], [(f"{n} days", a, b) for a, b, n in recent]), unsafe_allow_html=True)
+
+@st.fragment
+@metrics.timed("fragment.history_table", run=True)
+def history_table(athlete):
+    st.header("📜 Log")
+    # Paginated like the Bible: only one page of rows is ever built and sent
+    rows, pages = history_page(athlete, st.session_state.get("history_page", 1))
+    st.session_state["history_page"] = min(max(st.session_state.get("history_page", 1), 1), pages)
+    total = len(history_store(athlete).rows)
+    if st.toggle("📊 Interactive table", key="history_interactive"):
+        st.dataframe(history.History(rows).to_frame(), use_container_width=True, hide_index=True)
+    else:
+        st.markdown(render.table_html(history.COLUMNS, rows), unsafe_allow_html=True)
+    st.caption(f"{len(rows)} of {total} logs, newest first")
+    if pages > 1:
+        st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, key="history_page")
+
+@st.fragment
+@metrics.timed("fragment.history_transfer", run=True)
+def history_transfer(athlete):
+    with st.expander("⇅ Import / Export"):
+        report = st.session_state.pop("history_import_report", None)
+        if report: st.success(f"Imported {report.imported:,} of {report.read:,} rows ({report.rejected:,} without a usable Date)")
+        failed = st.session_state.pop("history_import_error", None)
+        if failed: st.error(failed)
+        upload = st.file_uploader("CSV or JSONL (Date, Phase, Mood, Completed)", type=["csv", "jsonl", "ndjson"], key="history_upload")
+        if upload is not None and st.button("⬆️ Import", key="history_import"):
+            fmt = "csv" if upload.name.lower().endswith(".csv") else "jsonl"
+            bar = st.progress(0.0, text="Importing…")
+            try:
+                report = import_history(athlete, upload, fmt, lambda n, frac: bar.progress(frac or 0.0, text=f"{n:,} rows read"))
+            except history.ImportFailed as e:
+                bar.empty()
+                if not e.report.imported:
+                    st.error(f"Import failed: {e}")
+                else:
+                    # Chunks before the bad one are saved: rerun so analytics and the log show them
+                    st.session_state["history_import_error"] = f"Import stopped after {e.report.imported:,} rows (kept): {e}"
+                    st.rerun()
+            else:
+                # Analytics and the log table live outside this fragment
+                st.session_state["history_import_report"] = report
+                st.rerun()
+        fmt = st.radio("Export format", ["CSV", "JSONL"], horizontal=True, key="history_export_fmt").lower()
+        slug = history.athlete_slug(athlete)
+        st.download_button("⬇️ Export", lambda: export_history(athlete, fmt), file_name=f"{slug}_history.{fmt}", mime="text/csv" if fmt == "csv" else "application/x-ndjson")
+
+def perf_panel():
+    # Hidden unless ATHLETE_METRICS=1 and the URL carries ?perf=1
+    spans, counters = metrics.summary()
+    with st.sidebar.expander("⏱️ Performance"):
+        st.markdown(render.table_html(["Span", "n", "p50 ms", "p95 ms", "p99 ms"], [(n, c, f"{p50:.1f}", f"{p95:.1f}", f"{p99:.1f}") for n, c, p50, p95, p99 in spans]), unsafe_allow_html=True)
+        st.markdown(render.table_html(["Counter", "Total"], sorted(counters.items())), unsafe_allow_html=True)
+        hits, misses, reloads = (counters.get(f"history.store_{k}", 0) for k in ("hit", "miss", "reload"))
+        st.caption(f"History stores: {hits:,} hits, {misses:,} loads, {reloads:,} reloads | log: {metrics.METRICS_LOG}")
+
+# ==========================================
+# 5. MAIN UI
+# ==========================================
+@metrics.timed("rerun", run=True)
 def main():
     st.title("🛡️ Bulletproof Athlete v16")
     
@@ -117,6 +250,7 @@ def main():
     # --- SIDEBAR ---
     st.sidebar.divider()
     st.sidebar.header("⚙️ Profile")
+    athlete = st.sidebar.text_input("Athlete", "default", key="athlete")
     
     if mode == "Life Protocol (Foundation)":
         days_active = st.sidebar.number_input("Days Active", min_value=1, value=1)
@@ -127,33 +261,27 @@ def main():
     else:
         # 12-Week Course Settings
         st.sidebar.info("🏆 12-Week Transformation Mode")
-        # List of weeks 1-12
-        week_list = list(range(1, 13))
-        selected_week = st.sidebar.selectbox("Select Week", week_list)
-        selected_day = st.sidebar.radio("Select Day", ["Day 1", "Day 2", "Day 3", "Day 4"])
+        selected_week = st.sidebar.selectbox("Select Week", plans.course_weeks())
+        selected_day = st.sidebar.radio("Select Day", plans.COURSE_DAYS)
         location = "Gym" # Default for course, though exercises are bodyweight heavy
 
     if st.sidebar.button("🗑️ Clear Logs"):
-        clear_history()
+        clear_history(athlete)
         st.sidebar.success("Logs Cleared")
         st.rerun()
 
     # Meds (Shared)
+    today = datetime.date.today().isoformat()
     st.sidebar.divider()
     st.sidebar.header("💊 Daily Stack")
-    with st.sidebar.expander("Morning"): st.checkbox("L-Carnitine"); st.checkbox("NMN")
-    with st.sidebar.expander("Breakfast"): 
-        st.checkbox("Ubiquinol + Omega3")
-        st.checkbox("B12 + C")
-        st.checkbox("Vit E")
-        st.checkbox("Vit D3 (Sundays Only)")
-    with st.sidebar.expander("Night"): st.checkbox("Magnesium"); st.checkbox("Zinc")
+    with st.sidebar: daily_stack(athlete, today)
+    if metrics.ENABLED and st.query_params.get("perf") == "1": perf_panel()
 
     # --- TAB 1: WORKOUT DISPLAY ---
-    with tab_workout:
-        streak = get_streak(load_history())
+    with tab_workout, metrics.span("tab.workout"):
+        streak, longest = get_streak(athlete)
         col1, col2 = st.columns([1,3])
-        col1.metric("🔥 Streak", f"{streak}")
+        col1.metric("🔥 Streak", f"{streak}", help=f"Longest: {longest} days")
         mood = col2.selectbox("Daily Status", ["Neutral", "Great / Strong", "Tired / Low Energy", "Injured / Pain"])
         
         msg, override = ai_coach(1, mode, mood)
@@ -161,8 +289,8 @@ def main():
         else: st.info(msg)
 
         if st.button("✅ Log Complete"):
-            log_key = f"Week {selected_week} {selected_day}" if mode == "12-Week Transformation" else datetime.date.today().strftime("%Y-%m-%d")
-            save_history(log_key, mode, mood, "Yes")
+            log_key = f"Week {selected_week} {selected_day}" if mode == "12-Week Transformation" else today
+            save_history(athlete, log_key, mode, mood, "Yes")
             st.success("Workout Logged!")
 
         # === RENDER: LIFE PROTOCOL ===
@@ -170,74 +298,29 @@ def main():
             today_name = datetime.datetime.now().strftime("%A")
             st.header(f"📅 {today_name}")
             
-            plan = {}
-            if override:
-                plan = {"Focus": "Emergency Rehab", "Type": "Rehab", "Exercises": data.HOME_REPAIR["Thursday"], "Core": [], "Warmup": [], "Cooldown": []} 
-            else:
-                plan = get_daily_plan(data.FOUNDATION_PHASES["Phase 1: Structural Repair"], today_name, location == "Home")
+            plan = get_daily_plan(today_name, location == "Home", override)
+            plan_key = f"{today_name}_{location}_{override}"
 
-            st.markdown(f"<div class='banner repair'><h3>{plan['Focus']}</h3></div>", unsafe_allow_html=True)
-            
-            if plan.get("Warmup"):
-                with st.expander("🔥 Warmup"):
-                    for w in plan["Warmup"]: st.checkbox(f"**{w['name']}** ({w['time']})")
-            
-            st.subheader("🏋️ Routine")
-            for i, ex in enumerate(plan["Exercises"]):
-                with st.container():
-                    c1, c2, c3 = st.columns([3,2,1])
-                    link = get_youtube_link(ex['name'])
-                    c1.markdown(f"**{i+1}. {ex['name']}** [[📺 Demo]]({link})")
-                    if plan["Type"] == "Gym" and "alt" in ex and ex["alt"] != "-": c1.markdown(f"<span class='alt-text'>Gym Busy? {ex['alt']}</span>", unsafe_allow_html=True)
-                    c2.markdown(f"**Sets:** {ex.get('sets','?')} | **Tempo:** <span class='tempo-tag'>{ex.get('tempo','-')}</span>", unsafe_allow_html=True)
-                    if "note" in ex: c2.caption(f"💡 {ex['note']}")
-                    c3.checkbox("Done", key=f"ex_{i}")
-                    st.markdown("---")
-            
-            if plan.get("Core"):
-                st.markdown("<div class='core-box'><h4>🧱 Core Finisher</h4>", unsafe_allow_html=True)
-                for c in plan["Core"]: st.checkbox(f"{c['name']} ({c['sets']})")
-                st.markdown("</div>", unsafe_allow_html=True)
-            
-            if plan.get("Cooldown"):
-                 st.subheader("❄️ Cooldown")
-                 for c in plan["Cooldown"]: st.checkbox(f"**{c['name']}** ({c['time']})")
+            st.markdown(render.banner_html(plan.theme, plan.focus), unsafe_allow_html=True)
+            routine_checklist(plan, plan_key, athlete, today, heading="🏋️ Routine")
 
         # === RENDER: 12-WEEK COURSE ===
         else:
-            c_data = data.COURSE_DATA[selected_week]
-            w_data = c_data["Schedule"][selected_day]
-            st.markdown(f"<div class='banner {c_data['Theme']}'><h2>Week {selected_week} - {selected_day}</h2><p>{c_data['Phase']} | Focus: {w_data['Focus']}</p></div>", unsafe_allow_html=True)
-            
-            for i, ex in enumerate(w_data["Exercises"]):
-                with st.container():
-                    c1, c2, c3 = st.columns([3,2,1])
-                    link = get_youtube_link(ex['name'])
-                    c1.markdown(f"**{i+1}. {ex['name']}** [[📺 Demo]]({link})")
-                    c2.markdown(f"**Sets:** {ex['sets']} | **Tempo:** <span class='tempo-tag'>{ex['tempo']}</span>", unsafe_allow_html=True)
-                    c2.caption(f"💡 {ex['note']}")
-                    c3.checkbox("Done", key=f"wc_{i}")
-                    st.markdown("---")
+            plan = plans.course_plan(selected_week, selected_day)
+            st.markdown(render.banner_html(plan.theme, f"Week {selected_week} - {selected_day}", f"{plan.phase} | Focus: {plan.focus}", level=2), unsafe_allow_html=True)
+            load = plans.course_load(selected_week, selected_day)
+            st.caption(f"📊 Volume: {load.reps} reps | ⏱️ Time under tension: ~{load.seconds / 60:.0f} min")
+            routine_checklist(plan, f"w{selected_week}_{selected_day}", athlete, today)
 
     # --- TAB 2: BIBLE ---
-    with tab_bible:
-        st.header("📖 Exercise Encyclopedia")
-        search = st.text_input("🔍 Search", "")
-        display_data = {k: v for k, v in data.EXERCISE_BIBLE.items() if search.lower() in k.lower()} if search else data.EXERCISE_BIBLE
-        for name, data_entry in display_data.items():
-            st.markdown(f"""
-            <div class="bible-card">
-                <h4>{name}</h4>
-                <p><strong>Muscle:</strong> {data_entry['Muscle']} | <strong>Stretch:</strong> {data_entry['Stretch']}</p>
-                <p><em>"{data_entry['Cue']}"</em></p>
-                <a href="{get_youtube_link(name)}" target="_blank">📺 Demo</a>
-            </div>
-            """, unsafe_allow_html=True)
+    with tab_bible, metrics.span("tab.bible"):
+        bible_search()
 
     # --- TAB 3: HISTORY ---
-    with tab_history:
-        st.header("📜 Log")
-        st.dataframe(load_history().sort_values("Date", ascending=False), use_container_width=True)
+    with tab_history, metrics.span("tab.history"):
+        training_analytics(athlete)
+        history_table(athlete)
+        history_transfer(athlete)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,313 @@
+# bench.py
+# Performance benchmarks. Run: python bench.py [micro|startup|app|all] [--json out.json] [--quick]
+#   micro   -> streak tracker, search index and history import/export in isolation
+#   startup -> cold import + first render, this tree vs the first commit
+#   app     -> headless reruns of app.py (Streamlit AppTest) per mode, history and catalog size
+# Results can be written as JSON; `app` fails (exit 1) when a scenario exceeds bench_thresholds.json.
+import argparse
+import csv
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import data
+import history
+import search
+import streak
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# ==========================================
+# 1. HELPERS
+# ==========================================
+def timed(fn, repeat=5):
+    """Best-of-`repeat` wall time of fn() in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def synthetic_days(n, gap_every=97, start=datetime.date(2000, 1, 1)):
+    """n logged calendar days from `start`, with a missed day every `gap_every`.
+
+    Returns (keys, last_day); 1M days runs well past today, so pass last_day as "today".
+    """
+    keys, day = [], start
+    while len(keys) < n:
+        if (day - start).days % gap_every != gap_every - 1:
+            keys.append(day.isoformat())
+        day += datetime.timedelta(days=1)
+    return keys, day - datetime.timedelta(days=1)
+
+
+WORDS = ["goblet", "split", "squat", "press", "row", "curl", "plank", "bridge", "lunge", "raise",
+         "cable", "band", "single", "leg", "incline", "decline", "hold", "pushup", "hinge", "carry"]
+MUSCLES = ["Quads", "Glutes", "Hamstrings", "Adductors", "Chest", "Lats", "Shoulders", "Core", "Triceps", "Biceps"]
+
+
+def synthetic_catalog(n):
+    """n Bible-style entries with three-word names (deterministic)."""
+    entries = []
+    for i in range(n):
+        name = " ".join(WORDS[(i // len(WORDS) ** k) % len(WORDS)] for k in range(3)).title() + f" {i}"
+        muscle = MUSCLES[i % len(MUSCLES)]
+        entries.append(search.Entry(name, muscle, "Couch Stretch", f"Keep the {muscle.lower()} loaded.", "Bible"))
+    return entries
+
+
+# ==========================================
+# 2. BENCHMARKS
+# ==========================================
+def bench_streak(sizes=(10_000, 100_000, 1_000_000)):
+    for n in sizes:
+        keys, last_day = synthetic_days(n)
+        tracker = streak.StreakTracker()
+        rebuild_ms = timed(lambda: tracker.rebuild(keys), repeat=3)
+        new_day = (last_day + datetime.timedelta(days=1)).isoformat()
+        add_ms = timed(lambda: tracker.add(new_day))
+        current_ms = timed(lambda: tracker.current(last_day))
+        print(f"streak n={n:>9,}: rebuild {rebuild_ms:9.2f} ms | add {add_ms:7.4f} ms | current {current_ms:7.4f} ms")
+        yield {"bench": "streak", "n": n, "rebuild_ms": rebuild_ms, "add_ms": add_ms, "current_ms": current_ms}
+
+
+def bench_search(sizes=(20, 1_000, 10_000), queries=("squat", "muscle:adductors", "incline pres", "hamstrng", "band row 42")):
+    for n in sizes:
+        entries = synthetic_catalog(n)
+        build_ms = timed(lambda: search.SearchIndex(entries), repeat=3)
+        index = search.SearchIndex(entries)
+        worst = max(timed(lambda: index.search(q, limit=50)) for q in queries)
+        print(f"search n={n:>9,}: build {build_ms:9.2f} ms | worst query {worst:7.3f} ms")
+        yield {"bench": "search", "n": n, "build_ms": build_ms, "worst_query_ms": worst}
+
+
+def bench_transfer(sizes=(100_000, 1_000_000)):
+    """Bulk CSV import into an empty store, then a full CSV export."""
+    for n in sizes:
+        keys, _ = synthetic_days(n)
+        with tempfile.TemporaryDirectory() as work:
+            src = os.path.join(work, "import.csv")
+            with open(src, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(history.COLUMNS)
+                writer.writerows((key, "Life Protocol (Foundation)", "Neutral", "Yes") for key in keys)
+            store = history.HistoryStore(os.path.join(work, "workout_history.csv"))
+            t0 = time.perf_counter()
+            with open(src, "rb") as f:
+                history.import_history(store, f)
+            import_ms = (time.perf_counter() - t0) * 1000
+            store.wait()
+            export_ms = timed(lambda: sum(len(block) for block in history.export_history(store)), repeat=1)
+        print(f"transfer n={n:>9,}: import {import_ms:9.0f} ms | export {export_ms:9.0f} ms")
+        yield {"bench": "transfer", "n": n, "import_ms": import_ms, "export_ms": export_ms}
+
+
+# Cold process: import streamlit + first headless run of app.py, reported from inside the child
+STARTUP_PROBE = """
+import resource, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+AppTest.from_file("app.py", default_timeout=120).run()
+rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(f"{(time.perf_counter() - t0) * 1000:.0f} {rss_mb:.0f} {'pandas' in sys.modules}")
+"""
+
+
+def _startup(app_dir, repeat=3):
+    samples = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cwd:  # empty history, like a fresh worker
+            for name in os.listdir(app_dir):
+                os.symlink(os.path.join(app_dir, name), os.path.join(cwd, name))
+            out = subprocess.run([sys.executable, "-c", STARTUP_PROBE], cwd=cwd, capture_output=True, text=True, check=True)
+            ms, rss, pandas_loaded = out.stdout.split()[-3:]
+            samples.append((float(ms), float(rss), pandas_loaded))
+    return min(samples)
+
+
+def bench_startup(ref=None):
+    """Cold import + first render of this tree vs `ref` (default: the first commit)."""
+    ref = ref or subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=HERE, capture_output=True, text=True, check=True).stdout.split()[0]
+    with tempfile.TemporaryDirectory() as before:
+        archive = subprocess.run(["git", "archive", ref], cwd=HERE, capture_output=True, check=True).stdout
+        subprocess.run(["tar", "-x", "-C", before], input=archive, check=True)
+        for label, app_dir in ((f"before ({ref[:7]})", before), ("after", HERE)):
+            ms, rss, pandas_loaded = _startup(app_dir)
+            print(f"startup {label:>16}: {ms:7.0f} ms | peak RSS {rss:5.0f} MB | pandas imported: {pandas_loaded}")
+            yield {"bench": "startup", "tree": label, "first_render_ms": ms, "peak_rss_mb": rss, "pandas_imported": pandas_loaded == "True"}
+
+
+# ==========================================
+# 3. APP SUITE (headless Streamlit reruns)
+# ==========================================
+HISTORY_SIZES = (10, 1_000, 100_000, 1_000_000)
+CATALOG_SIZES = (20, 1_000, 10_000)
+QUICK_HISTORY_SIZES = (10, 1_000)
+QUICK_CATALOG_SIZES = (20, 1_000)
+RERUNS = 5
+BIBLE_QUERIES = ("squat", "muscle:adductors", "hamstrng")
+
+
+def write_history(path, n):
+    """Snapshot CSV with n logged days (see synthetic_days), as the app itself writes it."""
+    keys, _ = synthetic_days(n)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(history.COLUMNS)
+        writer.writerows((key, "Life Protocol (Foundation)", "Neutral", "Yes") for key in keys)
+
+
+def write_catalog(content_dir, n):
+    """Copy of the shipped packs with the Bible replaced by n synthetic entries."""
+    for name in os.listdir(data.CONTENT_DIR):
+        if name.endswith(".json"):
+            shutil.copy(os.path.join(data.CONTENT_DIR, name), content_dir)
+    bible = {e.name: {"Muscle": e.muscle, "Stretch": e.stretch, "Cue": e.cue} for e in synthetic_catalog(n)}
+    with open(os.path.join(content_dir, "bible.json"), "w", encoding="utf-8") as f:
+        json.dump({"pack": "bible", "format": data.PACK_FORMAT, "tables": {"EXERCISE_BIBLE": bible}}, f)
+
+
+def _widget(elements, label):
+    return next(w for w in elements if w.label == label)
+
+
+def _measure(at, steps):
+    """Applies each step (a function of the AppTest) and times the rerun it triggers."""
+    samples = []
+    for step in steps:
+        step(at)
+        t0 = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - t0) * 1000)
+        if at.exception:
+            raise RuntimeError(f"app raised: {at.exception[0].message}")
+    return samples
+
+
+def _scenarios(history_rows, catalog, modes=True):
+    """(name, steps) pairs; every step ends in one rerun of app.py."""
+    def life(location, mood):
+        def setup(at):
+            _widget(at.sidebar.selectbox, "Select Training Mode").set_value("Life Protocol (Foundation)")
+            _widget(at.sidebar.radio, "Location").set_value(location) if any(r.label == "Location" for r in at.sidebar.radio) else None
+            _widget(at.selectbox, "Daily Status").set_value(mood)
+        return setup
+
+    def course(week, day):
+        def setup(at):
+            _widget(at.sidebar.selectbox, "Select Training Mode").set_value("12-Week Transformation")
+            if any(s.label == "Select Week" for s in at.sidebar.selectbox):
+                _widget(at.sidebar.selectbox, "Select Week").set_value(week)
+                _widget(at.sidebar.radio, "Select Day").set_value(day)
+        return setup
+
+    def bible(query):
+        return lambda at: _widget(at.text_input, "🔍 Search").set_value(query)
+
+    def history_tab(interactive):
+        return lambda at: _widget(at.toggle, "📊 Interactive table").set_value(interactive)
+
+    if catalog is not None:
+        yield f"bible/{catalog}", [bible("")] + [bible(q) for q in BIBLE_QUERIES * 2]
+    if not modes:
+        return
+    noop = [lambda at: None] * RERUNS
+    yield "life/gym", [life("Gym", "Neutral")] + noop
+    yield "life/home", [life("Home", "Neutral")] + noop
+    yield "life/injured", [life("Gym", "Injured / Pain")] + noop
+    yield "history/preview", [history_tab(False)] + noop
+    yield "history/interactive", [history_tab(True)] + noop
+    if history_rows == min(HISTORY_SIZES):
+        # Plan-only scenarios don't depend on history size; run them once
+        weeks = [course(w, d) for w in range(1, data.COURSE_WEEKS + 1) for d in ("Day 1", "Day 2", "Day 3", "Day 4")]
+        yield "course/all-days", [course(1, "Day 1")] + weeks
+
+
+def run_app_suite(history_sizes=HISTORY_SIZES, catalog_sizes=CATALOG_SIZES):
+    from streamlit.testing.v1 import AppTest
+
+    shipped = data.CONTENT_DIR
+    cwd = os.getcwd()
+    try:
+        for rows in history_sizes:
+            for catalog in (catalog_sizes if rows == min(history_sizes) else (None,)):
+                with tempfile.TemporaryDirectory() as work:
+                    os.chdir(work)  # HISTORY_FILE is relative to the working directory
+                    write_history(os.path.join(work, "workout_history.csv"), rows)
+                    if catalog is not None:
+                        os.mkdir("content")
+                        write_catalog("content", catalog)
+                        data.set_content_dir(os.path.join(work, "content"))
+                    modes = catalog in (None, catalog_sizes[0])  # mode scenarios once per history size
+                    for name, steps in _scenarios(rows, catalog, modes):
+                        at = AppTest.from_file(os.path.join(HERE, "app.py"), default_timeout=600)
+                        first_ms = _measure(at, [lambda at: None])[0]
+                        samples = _measure(at, steps)
+                        result = {
+                            "bench": "app", "scenario": name, "history_rows": rows, "catalog": catalog,
+                            "first_run_ms": first_ms, "rerun_ms_p50": statistics.median(samples), "rerun_ms_max": max(samples),
+                        }
+                        print(f"app {name:<20} rows={rows:>9,}: first {first_ms:8.0f} ms | p50 {result['rerun_ms_p50']:7.1f} ms | max {result['rerun_ms_max']:7.1f} ms")
+                        yield result
+                    data.set_content_dir(shipped)
+                    os.chdir(cwd)
+    finally:
+        os.chdir(cwd)
+        data.set_content_dir(shipped)
+
+
+def check_thresholds(results, path=os.path.join(HERE, "bench_thresholds.json")):
+    """Failure messages for app results whose p50 rerun exceeds its budget.
+
+    Budgets are looked up by full scenario name ("history/interactive"), then by kind ("history").
+    """
+    with open(path, encoding="utf-8") as f:
+        budgets = json.load(f)["rerun_ms_p50"]
+    failures = []
+    for r in results:
+        if r["bench"] != "app":
+            continue
+        budget = budgets.get(r["scenario"], budgets.get(r["scenario"].split("/")[0]))
+        if budget is not None and r["rerun_ms_p50"] > budget:
+            failures.append(f"{r['scenario']} (rows={r['history_rows']}, catalog={r['catalog']}): p50 {r['rerun_ms_p50']:.1f} ms > {budget} ms")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("suite", nargs="?", default="all", choices=("micro", "startup", "app", "all"))
+    parser.add_argument("--json", help="write results as JSON to this path")
+    parser.add_argument("--quick", action="store_true", help="small histories and catalogs only")
+    args = parser.parse_args(argv)
+
+    results = []
+    if args.suite in ("micro", "all"):
+        results += bench_streak() if not args.quick else bench_streak((10_000,))
+        results += bench_search() if not args.quick else bench_search((20, 1_000))
+        results += bench_transfer() if not args.quick else bench_transfer((10_000,))
+    if args.suite in ("startup", "all"):
+        results += bench_startup()
+    if args.suite in ("app", "all"):
+        sizes = (QUICK_HISTORY_SIZES, QUICK_CATALOG_SIZES) if args.quick else (HISTORY_SIZES, CATALOG_SIZES)
+        results += run_app_suite(*sizes)
+    failures = check_thresholds(results)
+    if args.json:
+        meta = {"python": platform.python_version(), "platform": platform.platform(), "time": datetime.datetime.now().isoformat(timespec="seconds")}
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results, "failures": failures}, f, indent=2)
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
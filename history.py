@@ -0,0 +1,606 @@
+# history.py
+import contextlib
+import csv
+import datetime
+import fcntl
+import hashlib
+import io
+import itertools
+import json
+import operator
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from typing import NamedTuple
+
+import metrics
+from analytics import Rollups
+from streak import StreakTracker
+
+# ==========================================
+# 1. JOURNALED HISTORY STORE
+# ==========================================
+# Layout on disk (per history file):
+#   workout_history.csv              -> snapshot (same layout as the legacy file)
+#   workout_history.csv.journal      -> append-only log of upserts since the snapshot
+#   workout_history.csv.compacting   -> journal being folded in (only during compaction)
+#   workout_history.csv.lock         -> flock()ed by the one process compacting the file
+# A legacy workout_history.csv is simply read as the snapshot, so old files
+# migrate on first use and get rewritten by the first compaction.
+
+COLUMNS = ["Date", "Phase", "Mood", "Completed"]
+COMPACT_EVERY = 500  # journal entries before a background compaction
+MAX_HOT_STORES = 16  # recently active history files kept in memory
+MAX_RESIDENT_ROWS = 2_000_000  # rows across hot stores before the coldest are dropped
+
+_VERSIONS = itertools.count(1)  # process-wide, so a recreated store never reuses a version
+
+
+def _encode_rows(rows):
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
+def _encode(row):
+    return _encode_rows((row,))
+
+
+def _stat_sig(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _read_journal(path):
+    """Yields complete journal rows; a torn last line from a crash is ignored."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return
+    end = raw.rfind(b"\n") + 1
+    for row in csv.reader(io.StringIO(raw[:end].decode("utf-8"))):
+        if len(row) == len(COLUMNS):
+            yield row
+
+
+def _trim_torn_tail(fd):
+    """Cuts a torn last line (crash mid-append) so the next append starts on a fresh line."""
+    size = os.fstat(fd).st_size
+    if not size or os.pread(fd, 1, size - 1) == b"\n":
+        return
+    end = size
+    while end > 0:
+        start = max(0, end - 4096)
+        newline = os.pread(fd, end - start, start).rfind(b"\n")
+        if newline >= 0:
+            end = start + newline + 1
+            break
+        end = start
+    os.ftruncate(fd, end)
+
+
+def _read_snapshot(path):
+    """Yields (Date, (Phase, Mood, Completed)) from a snapshot CSV; nothing if it is missing."""
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            for rec in csv.DictReader(f):
+                yield str(rec["Date"]), (rec["Phase"], rec["Mood"], rec["Completed"])
+    except FileNotFoundError:
+        return
+
+
+class HistoryStore:
+    """Workout history for one file: snapshot + journal, indexed by Date."""
+
+    def __init__(self, path):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.compacting_path = path + ".compacting"
+        self._lock = threading.RLock()
+        self._compactor = None
+        self.rows = {}  # Date -> (Phase, Mood, Completed), in first-logged order
+        self.streaks = None  # StreakTracker over self.rows, updated on every write
+        self.rollups = None  # analytics.Rollups over self.rows, updated on every write
+        self._journal_len = 0
+        self.version = 0
+        self._sig = None
+        self._load()
+
+    def _files_sig(self):
+        return tuple(_stat_sig(p) for p in (self.path, self.journal_path, self.compacting_path))
+
+    def _touch(self, before=None):
+        """Records our own write: a new version, and the file state we now expect on disk.
+
+        `before` is the files' signature just before the write. If another process
+        had changed them since we last synced, the old signature is kept so the
+        next refresh() reloads instead of trusting memory.
+        """
+        self.version = next(_VERSIONS)
+        if before is None or before == self._sig:
+            self._sig = self._files_sig()
+
+    def _load(self):
+        sig = self._files_sig()  # taken first: a write landing mid-read triggers another reload
+        rows = dict(_read_snapshot(self.path))
+        snapshot_len, journal_len = len(rows), 0  # snapshot Dates are unique once compacted
+        for path in (self.compacting_path, self.journal_path):
+            for date, phase, mood, completed in _read_journal(path):
+                rows[date] = (phase, mood, completed)
+                journal_len += 1
+        self.rows, self._journal_len = rows, journal_len
+        metrics.count("history.rows_read", snapshot_len + journal_len)
+        self._sig = sig
+        self.reindex()
+
+    def reindex(self):
+        """Rebuilds the streak and rollup indexes from the rows (on load and after a bulk import)."""
+        with self._lock:
+            self.streaks = StreakTracker(self.rows)
+            self.rollups = Rollups(self.rows)
+            self.version = next(_VERSIONS)
+
+    def refresh(self):
+        """Reloads if another process changed the files; costs three stat() calls otherwise."""
+        with self._lock:
+            if self._files_sig() != self._sig:
+                metrics.count("history.store_reload")  # another process wrote the file
+                self._load()
+            return self.version
+
+    def page(self, page, page_size):
+        """(rows on 1-based `page` newest first, page count), straight from the sorted key index."""
+        with self._lock:
+            keys, pages = self.rollups.page(page, page_size)
+            return [(key, *self.rows[key]) for key in keys], pages
+
+    def _append(self, block):
+        """Appends encoded rows to the journal with one fsync. Caller holds the lock.
+
+        The journal is flock()ed while writing, so a compaction that renames it
+        away can wait for appends already under way (see compact()).
+        """
+        os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+        while True:
+            fd = os.open(self.journal_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                if (_stat_sig(self.journal_path) or (None,))[0] != os.fstat(fd).st_ino:
+                    continue  # renamed to .compacting after we opened it: append to the new journal
+                _trim_torn_tail(fd)
+                os.write(fd, block)
+                os.fsync(fd)
+                metrics.count("history.bytes_written", len(block))
+                return
+            finally:
+                os.close(fd)
+
+    def upsert(self, date, phase, mood, completed):
+        row = (str(date), phase, mood, completed)
+        line = _encode(row)
+        with self._lock:
+            self.refresh()  # another process may have logged since we last looked
+            before = self._files_sig()
+            self._append(line)
+            old = self.rows.get(row[0])
+            self.rows[row[0]] = row[1:]
+            self.streaks.add(row[0])
+            self.rollups.update(row[0], old, row[1:])
+            self._journal_len += 1
+            self._touch(before)
+            if self._journal_len >= COMPACT_EVERY:
+                self._start_compaction()
+
+    def upsert_many(self, items, bulk=False):
+        """Upserts (Date, (Phase, Mood, Completed)) pairs with one journal append and one fsync.
+
+        Later pairs win, exactly as if upsert() were called for each. With bulk=True the
+        indexes and compaction are left for the caller to run once at the end (reindex()).
+        """
+        if not items:
+            return
+        block = _encode_rows((date, *row) for date, row in items)
+        with self._lock:
+            self.refresh()
+            before = self._files_sig()
+            self._append(block)
+            if bulk:
+                self.rows.update(items)
+            else:
+                for date, row in items:
+                    old = self.rows.get(date)
+                    self.rows[date] = row
+                    self.streaks.add(date)
+                    self.rollups.update(date, old, row)
+            self._journal_len += len(items)
+            self._touch(before)
+            if not bulk and self._journal_len >= COMPACT_EVERY:
+                self._start_compaction()
+
+    def clear(self):
+        self.wait()
+        with _compaction_lock(self.path, wait=True), self._lock:  # same order as compact()
+            removed = False
+            for path in (self.path, self.journal_path, self.compacting_path):
+                if os.path.exists(path):
+                    os.remove(path)
+                    removed = True
+            self.rows, self._journal_len = {}, 0
+            self.streaks = StreakTracker()
+            self.rollups = Rollups()
+            self._touch()
+            return removed
+
+    # --- compaction ---
+    def _start_compaction(self):
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="history-compact", daemon=True)
+        self._compactor.start()
+
+    def wait(self):
+        """Blocks until a running background compaction has finished."""
+        compactor = self._compactor
+        if compactor is not None and compactor is not threading.current_thread():
+            compactor.join()
+
+    def compact(self):
+        """Folds the journal into a fresh snapshot written via fsync + atomic rename.
+
+        The snapshot is rebuilt from the files rather than from memory, so rows
+        that other processes appended to the journal are kept. Only one process
+        compacts a file at a time; the others skip and leave it to that one.
+        """
+        with _compaction_lock(self.path) as locked:
+            if locked:
+                self._compact()
+            else:
+                self._journal_len = 0  # another process is folding the journal in
+                metrics.count("history.compaction_skipped")
+
+    def _compact(self):
+        with self._lock:
+            before = self._files_sig()
+            if os.path.exists(self.journal_path) and not os.path.exists(self.compacting_path):
+                os.replace(self.journal_path, self.compacting_path)
+            self._journal_len = 0
+            if before == self._sig:
+                self._sig = self._files_sig()
+        try:
+            # Appends that opened the journal before the rename hold its flock until fsynced
+            fd = os.open(self.compacting_path, os.O_RDONLY)
+        except FileNotFoundError:
+            pass
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            os.close(fd)
+        # The snapshot is written outside the lock so logging is never blocked on it.
+        rows = dict(_read_snapshot(self.path))
+        for date, phase, mood, completed in _read_journal(self.compacting_path):
+            rows[date] = (phase, mood, completed)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            writer.writerows((date, *row) for date, row in rows.items())
+            f.flush()
+            os.fsync(f.fileno())
+            metrics.count("history.bytes_written", f.tell())
+        with self._lock:
+            before = self._files_sig()
+            os.replace(tmp, self.path)
+            if os.path.exists(self.compacting_path):
+                os.remove(self.compacting_path)
+            # Same rows, new files: keep the version so cached views stay valid
+            # (unless someone else wrote meanwhile, which the next refresh picks up).
+            if before == self._sig:
+                self._sig = self._files_sig()
+
+
+@contextlib.contextmanager
+def _compaction_lock(path, wait=False):
+    """Inter-process flock on `path`.lock; yields whether it was taken (always, with wait=True)."""
+    lock_path = path + ".lock"
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        yield True
+    finally:
+        os.close(fd)  # releases the flock
+
+
+_STORES = OrderedDict()  # abspath -> HistoryStore, least recently used first
+_STORES_LOCK = threading.Lock()
+
+
+def get_store(path):
+    """Returns the process-wide store for `path` (shared by every session and rerun).
+
+    Stores form an LRU: only recently active files stay loaded, bounded by
+    MAX_HOT_STORES and MAX_RESIDENT_ROWS. An evicted file is reloaded from disk
+    the next time it is requested.
+    """
+    key = os.path.abspath(path)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            metrics.count("history.store_miss")  # first use or evicted: a full load from disk
+            store = _STORES[key] = HistoryStore(key)
+        else:
+            metrics.count("history.store_hit")
+        _STORES.move_to_end(key)
+        resident = sum(len(s.rows) for s in _STORES.values())
+        while len(_STORES) > 1 and (len(_STORES) > MAX_HOT_STORES or resident > MAX_RESIDENT_ROWS):
+            _, cold = _STORES.popitem(last=False)
+            resident -= len(cold.rows)
+        return store
+
+
+def athlete_slug(athlete):
+    """File-safe partition name for an athlete ("Jane Doe" -> "jane-doe-<hash>").
+
+    Unicode letters are kept, and a short hash of the normalized name keeps names
+    that reduce to the same letters apart ("José" / "Jos"). Only a blank name (or
+    "default") is the default athlete.
+    """
+    name = " ".join(unicodedata.normalize("NFKC", str(athlete)).casefold().split())
+    if name in ("", "default"):
+        return "default"
+    base = re.sub(r"[\W_]+", "-", name).strip("-")[:48]
+    digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:8]
+    return f"{base}-{digest}" if base else digest
+
+
+@lru_cache(maxsize=1024)
+def athlete_path(directory, athlete):
+    """History file of a named athlete in `directory`.
+
+    Partitions from before slugs were hashed ("jane-doe.csv") are kept for the
+    ASCII names they were created for; names they could have collided on start fresh.
+    """
+    slug = athlete_slug(athlete)
+    path = os.path.join(directory, f"{slug}.csv")
+    legacy = re.sub(r"[^a-z0-9]+", "-", str(athlete).strip().lower()).strip("-")
+    if legacy and slug == f"{legacy}-{slug[-8:]}" and not os.path.exists(path):
+        legacy_path = os.path.join(directory, f"{legacy}.csv")
+        if any(os.path.exists(legacy_path + ext) for ext in ("", ".journal", ".compacting")):
+            return legacy_path
+    return path
+
+
+# ==========================================
+# 2. COLUMNAR VIEW
+# ==========================================
+class History:
+    """Read-only, column-oriented rows (one list per column), e.g. one page of the History tab.
+
+    Strings are shared with the store, so a view costs one pointer per cell.
+    to_frame() is the only place pandas gets imported.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, records=()):
+        cols = list(zip(*records)) if records else [()] * len(COLUMNS)
+        self.columns = {name: list(col) for name, col in zip(COLUMNS, cols)}
+
+    def __len__(self):
+        return len(self.columns["Date"])
+
+    @property
+    def empty(self):
+        return not len(self)
+
+    def to_frame(self):
+        import pandas as pd  # deferred: only the interactive table view needs it
+
+        return pd.DataFrame(self.columns, columns=COLUMNS)
+
+
+# ==========================================
+# 3. BULK IMPORT / EXPORT
+# ==========================================
+# Files are streamed in chunks: each chunk is one journal append + fsync, the
+# indexes are rebuilt once at the end, and the usual background compaction
+# folds the journal into the snapshot.
+IMPORT_CHUNK = 50_000  # rows per journal append
+EXPORT_CHUNK = 10_000  # rows per yielded block
+IMPORT_DEFAULTS = {"Phase": "Imported", "Mood": "Neutral", "Completed": "Yes"}
+_LOOSE_COURSE_KEY = re.compile(r"^w(?:eek)?[\s_-]*0*(\d+)[\s,_-]*d(?:ay)?[\s_-]*0*(\d+)$", re.IGNORECASE)
+_LOOSE_DATE = re.compile(r"^(\d{4})[-/.]?(\d{1,2})[-/.]?(\d{1,2})(?:$|[T ])")
+_YES = {"yes", "y", "true", "1", "done", "completed", "x"}
+_NO = {"no", "n", "false", "0"}
+
+
+class ImportReport(NamedTuple):
+    read: int  # records in the file
+    imported: int  # rows upserted (later duplicates of a Date overwrite earlier ones)
+    rejected: int  # records without a recognisable Date
+
+
+class ImportFailed(ValueError):
+    """A file stopped parsing partway; `report` counts the rows imported (and kept) before that."""
+
+    def __init__(self, error, report):
+        super().__init__(str(error))
+        self.report = report
+
+
+def normalize_key(value):
+    """Canonical history key for a raw Date value ("2024-05-01", "Week 3 Day 2"), or None.
+
+    Accepts ISO dates and timestamps, 2024/5/1 and 20240501, and loose course keys
+    such as "week 03 day 2" or "W3D2".
+    """
+    value = str(value).strip()
+    head = value[:10]
+    if len(head) == 10 and head[4] == "-" and head[7] == "-" and (len(value) == 10 or value[10] in "T "):
+        try:
+            datetime.date.fromisoformat(head)
+            return head
+        except ValueError:
+            return None
+    m = _LOOSE_COURSE_KEY.match(value)
+    if m:
+        return f"Week {int(m.group(1))} Day {int(m.group(2))}"
+    m = _LOOSE_DATE.match(value)
+    if m:
+        try:
+            return datetime.date(*map(int, m.groups())).isoformat()
+        except ValueError:
+            return None
+    return None
+
+
+def _normalize_keys(dates):
+    """normalize_key over a chunk; a single C-level pass when every value is already a clean ISO date."""
+    try:
+        if list(map(datetime.date.isoformat, map(datetime.date.fromisoformat, dates))) == dates:
+            return dates
+    except (ValueError, TypeError):
+        pass
+    return [None if d is None else normalize_key(d) for d in dates]
+
+
+def _tail(tails, raw):
+    phase, mood, completed = (IMPORT_DEFAULTS[c] if v is None or str(v).strip() == "" else str(v).strip() for c, v in zip(COLUMNS[1:], raw))
+    low = completed.lower()
+    tail = tails[raw] = (phase, mood, "Yes" if low in _YES else "No" if low in _NO else completed)
+    return tail
+
+
+def _normalize(records, tails):
+    """(Date, (Phase, Mood, Completed)) pairs for a chunk of raw 4-field records; None for rejects.
+
+    The same few Phase/Mood/Completed combinations repeat across a whole file, so
+    each is normalized once (memoized in `tails`) and its tuple shared by every row.
+    """
+    keys = _normalize_keys([None if rec is None else rec[0] for rec in records])
+    out = []
+    append = out.append
+    for rec, key in zip(records, keys):
+        if key is None:
+            append(None)
+            continue
+        raw = rec[1:]
+        append((key, tails.get(raw) or _tail(tails, raw)))
+    return out
+
+
+def _pick(get, rec):
+    try:
+        return get(rec)
+    except IndexError:  # short row
+        return None
+
+
+def _csv_chunks(text, chunk):
+    reader = csv.reader(text)
+    header = next(reader, None)
+    if header is None:
+        return
+    index = {name.strip().lower(): i for i, name in enumerate(header)}
+    if "date" not in index:
+        raise ValueError(f"CSV import needs a Date column (got {', '.join(header)})")
+    width = len(header)
+    # Missing columns read a None appended at the end of each row
+    get = operator.itemgetter(*(width if index.get(c.lower()) is None else index[c.lower()] for c in COLUMNS))
+    pad = None in (index.get(c.lower()) for c in COLUMNS)
+    while True:
+        raw = list(itertools.islice(reader, chunk))
+        if not raw:
+            return
+        if pad:
+            for rec in raw:
+                del rec[width:]
+                rec.append(None)
+        try:
+            yield list(map(get, raw))
+        except IndexError:
+            yield [_pick(get, rec) for rec in raw]
+
+
+def _json_record(line):
+    try:
+        obj = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    obj = {str(k).lower(): v for k, v in obj.items()}
+    rec = tuple(obj.get(c.lower()) for c in COLUMNS)
+    if any(isinstance(v, (dict, list)) for v in rec):
+        return None  # a cell must be a scalar; nested values are rejected, not str()-ed
+    return rec
+
+
+def _jsonl_chunks(text, chunk):
+    while True:
+        lines = list(itertools.islice(text, chunk))
+        if not lines:
+            return
+        yield [_json_record(line) for line in lines if line.strip()]
+
+
+def import_history(store, f, fmt="csv", progress=None, chunk=IMPORT_CHUNK):
+    """Streams a CSV or JSONL file (binary, e.g. an upload) into `store`; returns an ImportReport.
+
+    Rows are upserted by Date in file order, so the last row for a Date wins, as
+    with repeated save_history calls. progress(records_read, fraction_or_None) is
+    called after every chunk. A malformed file raises ImportFailed; the chunks
+    before the bad one stay imported.
+    """
+    start = f.tell()
+    size = f.seek(0, io.SEEK_END) - start
+    f.seek(start)
+    text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+    chunks = _csv_chunks(text, chunk) if fmt == "csv" else _jsonl_chunks(text, chunk)
+    tails = {}
+    read = imported = 0
+    try:
+        for records in chunks:
+            batch = [pair for pair in _normalize(records, tails) if pair is not None]
+            store.upsert_many(batch, bulk=True)
+            read += len(records)
+            imported += len(batch)
+            metrics.count("history.rows_imported", len(batch))
+            if progress:
+                progress(read, min((f.tell() - start) / size, 1.0) if size else None)
+    except (ValueError, csv.Error) as e:  # includes UnicodeDecodeError
+        raise ImportFailed(e, ImportReport(read, imported, read - imported)) from e
+    finally:
+        text.detach()  # the caller owns the file
+        if imported:
+            store.reindex()
+            store._start_compaction()
+    return ImportReport(read, imported, read - imported)
+
+
+def export_history(store, fmt="csv", chunk=EXPORT_CHUNK):
+    """Yields the history as encoded CSV (with header) or JSONL blocks, keys in sorted order.
+
+    Only one chunk of rows is encoded at a time; rows logged during the export are left out.
+    """
+    with store._lock:
+        store.refresh()
+        rows, keys = store.rows, list(store.rollups.dates)
+    if fmt == "csv":
+        yield _encode(COLUMNS)
+    for i in range(0, len(keys), chunk):
+        block = [(key, *rows[key]) for key in keys[i:i + chunk]]
+        if fmt == "csv":
+            yield _encode_rows(block)
+        else:
+            yield "".join(json.dumps(dict(zip(COLUMNS, row))) + "\n" for row in block).encode("utf-8")
@@ -0,0 +1,147 @@
+# metrics.py
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from functools import wraps
+
+# Opt-in rerun instrumentation: ATHLETE_METRICS=1 turns it on.
+# - span(name) / @timed(name): wall time of a block or function
+# - count(name, n): counters (rows read, bytes written, delta messages, ...)
+# - @timed(name, run=True): one script run or fragment rerun; on exit its spans and counters
+#   are appended as one JSON line to METRICS_LOG for a local collector to tail.
+# Rolling p50/p95/p99 per span are kept in memory for the sidebar panel.
+# When disabled, span() returns a shared no-op and count() returns immediately.
+
+ENABLED = os.environ.get("ATHLETE_METRICS", "") == "1"
+METRICS_LOG = os.environ.get("ATHLETE_METRICS_LOG", "metrics.jsonl")
+WINDOW = 1000  # samples kept per span for the rolling percentiles
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullSpan()
+_LOCK = threading.Lock()
+_SAMPLES = defaultdict(lambda: deque(maxlen=WINDOW))  # span -> recent durations (ms)
+_TOTALS = defaultdict(int)  # counter -> process total
+_local = threading.local()  # the run in progress on this script thread
+
+
+class _Span:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, (time.perf_counter() - self.t0) * 1000)
+        return False
+
+
+def span(name):
+    return _Span(name) if ENABLED else _NULL
+
+
+def timed(name, run=False):
+    """Decorator form of span(); run=True makes each call a run (script or fragment rerun)."""
+    cls = _Run if run else _Span
+
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with cls(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def record(name, ms):
+    with _LOCK:
+        _SAMPLES[name].append(ms)
+    current = getattr(_local, "run", None)
+    if current is not None:
+        current["spans"][name] = current["spans"].get(name, 0.0) + ms
+
+
+def count(name, n=1):
+    if not ENABLED:
+        return
+    with _LOCK:
+        _TOTALS[name] += n
+    current = getattr(_local, "run", None)
+    if current is not None:
+        current["counters"][name] = current["counters"].get(name, 0) + n
+
+
+class _Run(_Span):
+    __slots__ = ("owner",)
+
+    def __enter__(self):
+        # A fragment called inside a full run is just a span of that run
+        self.owner = getattr(_local, "run", None) is None
+        if self.owner:
+            _local.run = {"ts": time.time(), "run": self.name, "spans": {}, "counters": {}}
+            _count_deltas()
+        return super().__enter__()
+
+    def __exit__(self, *exc):
+        super().__exit__(*exc)
+        if self.owner:
+            current, _local.run = _local.run, None
+            current["ms"] = current["spans"].pop(self.name, 0.0)
+            _append_log(current)
+        return False
+
+
+def _count_deltas():
+    """Counts messages Streamlit sends to the browser during this run."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx()
+        if ctx is None or getattr(ctx, "_athlete_counted", False):
+            return
+        enqueue = ctx._enqueue
+
+        def counting_enqueue(msg):
+            count("deltas")
+            return enqueue(msg)
+
+        ctx._enqueue = counting_enqueue
+        ctx._athlete_counted = True
+    except (ImportError, AttributeError):
+        pass  # internal API moved: the delta counter just stays at zero
+
+
+def _append_log(entry):
+    line = json.dumps(entry, separators=(",", ":")) + "\n"
+    with _LOCK:
+        with open(METRICS_LOG, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def _percentile(sorted_samples, q):
+    return sorted_samples[min(len(sorted_samples) - 1, int(q * len(sorted_samples)))]
+
+
+def summary():
+    """[(span, n, p50, p95, p99)] over the rolling window, slowest p95 first; and counter totals."""
+    with _LOCK:
+        samples = {name: sorted(s) for name, s in _SAMPLES.items() if s}
+        totals = dict(_TOTALS)
+    rows = [(name, len(s), _percentile(s, 0.50), _percentile(s, 0.95), _percentile(s, 0.99)) for name, s in samples.items()]
+    rows.sort(key=lambda row: row[3], reverse=True)
+    return rows, totals
@@ -0,0 +1,294 @@
+# plans.py
+import re
+import warnings
+from functools import lru_cache
+from typing import NamedTuple
+
+import data
+
+# ==========================================
+# 1. PLAN RECORDS (immutable, slot-based)
+# ==========================================
+class Prescription(NamedTuple):  # "3 x 10/leg" -> Prescription(3, reps=10, side="leg")
+    sets: int = 1
+    reps: int = 0  # per set; 0 for timed or to-failure sets
+    seconds: int = 0  # per set, for holds, intervals and cardio
+    side: str = ""  # "leg" / "side" / "arm" when the count is per side
+    to_failure: bool = False
+
+    @property
+    def per_side(self):
+        return bool(self.side)
+
+
+class Exercise(NamedTuple):
+    name: str
+    sets: str = "?"  # prescription as displayed
+    tempo: str = "-"
+    alt: str = "-"
+    note: str = ""
+    rx: Prescription = None  # parsed `sets`; None for free-form amounts ("1 Sachet")
+
+
+class Drill(NamedTuple):  # warmup / cooldown item
+    name: str
+    time: str
+    note: str = ""
+
+
+class Plan(NamedTuple):
+    focus: str
+    type: str  # Gym | Home | Recovery | Rehab | Course
+    exercises: tuple
+    core: tuple = ()
+    warmup: tuple = ()
+    cooldown: tuple = ()
+    theme: str = "repair"  # banner CSS class
+    phase: str = ""
+
+
+LIFE_PHASE = "Phase 1: Structural Repair"
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+COURSE_DAYS = ("Day 1", "Day 2", "Day 3", "Day 4")
+REHAB_DAY = "Thursday"  # HOME_REPAIR block served when the athlete reports pain
+REST_DAY = {"Focus": "Rest", "Type": "Recovery", "Category": "Mobility", "Home_Map": "Mobility", "Exercises": [{"name": "Walk", "sets": "30m", "tempo": "-", "alt": "-"}], "Core": []}
+
+
+# ==========================================
+# 2. PRESCRIPTIONS
+# ==========================================
+SETS_PATTERN = re.compile(r"^(?:(\d+)\s*x\s*)?(?:(\d+)\s*(s|m)?|(f|max))(?:\s*/\s*(leg|side|arm))?$", re.IGNORECASE)
+TEMPO_SECONDS = {  # seconds per rep for named tempos; "3-1-1" style tempos are summed
+    "slow": 4, "control": 4, "controlled": 4, "squeeze": 3, "max squeeze": 3, "hold": 3,
+    "fast": 1, "explosive": 1, "power": 1, "clap": 1, "sprint": 1, "touch": 1,
+}
+DEFAULT_REP_SECONDS = 2
+
+
+@lru_cache(maxsize=1024)
+def parse_sets(text):
+    """Prescription for a sets string ("3x15", "4 x 12", "3 x 20s", "3x10/leg", "4xF", "30m", "Max", "5/side"), or None."""
+    m = SETS_PATTERN.match(str(text).strip())
+    if not m:
+        return None
+    sets, count, unit, failure, side = m.groups()
+    sets = int(sets) if sets else 1
+    side = (side or "").lower()
+    if failure:
+        return Prescription(sets, side=side, to_failure=True)
+    if unit:
+        return Prescription(sets, seconds=int(count) * (60 if unit.lower() == "m" else 1), side=side)
+    return Prescription(sets, reps=int(count), side=side)
+
+
+def format_sets(rx):
+    """Display string for a Prescription (inverse of parse_sets)."""
+    if rx.to_failure:
+        body = "F" if rx.sets > 1 else "Max"
+    elif rx.seconds:
+        body = f"{rx.seconds // 60}m" if rx.seconds >= 300 and rx.seconds % 60 == 0 else f"{rx.seconds}s"
+    else:
+        body = str(rx.reps)
+    body = f"{rx.sets}x{body}" if rx.sets > 1 else body
+    return f"{body}/{rx.side}" if rx.side else body
+
+
+@lru_cache(maxsize=256)
+def rep_seconds(tempo):
+    """Seconds one rep takes at `tempo` ("3-1-1" -> 5, "Slow" -> 4, "Hold 5s" -> 7)."""
+    tempo = str(tempo).strip().lower()
+    if re.fullmatch(r"\d+(-\d+)+", tempo):
+        return sum(map(int, tempo.split("-")))
+    hold = re.search(r"(\d+)\s*s\b", tempo)
+    if hold:
+        return DEFAULT_REP_SECONDS + int(hold.group(1))
+    return TEMPO_SECONDS.get(tempo, DEFAULT_REP_SECONDS)
+
+
+def progress(rx, scale, extra_sets):
+    """`rx` with reps/seconds scaled and sets added; to-failure counts stay open-ended."""
+    seconds = rx.seconds
+    if seconds:
+        step = 60 if seconds >= 300 else 5  # cardio in whole minutes, holds in 5s steps
+        seconds = max(step, round(seconds * scale / step) * step)
+    reps = max(1, round(rx.reps * scale)) if rx.reps else 0
+    return rx._replace(sets=max(1, rx.sets + extra_sets), reps=reps, seconds=seconds)
+
+
+# ==========================================
+# 3. COMPILER
+# ==========================================
+def _exercises(items, where, errors, required=("name", "sets", "tempo")):
+    out = []
+    for i, ex in enumerate(items):
+        missing = [k for k in required if k not in ex]
+        if missing:
+            errors.append(f"{where} exercise {i + 1}: missing {', '.join(missing)}")
+            continue
+        out.append(Exercise(ex["name"], ex["sets"], ex.get("tempo", "-"), ex.get("alt", "-"), ex.get("note", ""), parse_sets(ex["sets"])))
+    return tuple(out)
+
+
+def _drills(items):
+    return tuple(Drill(d["name"], d["time"], d.get("note", d.get("target", ""))) for d in items)
+
+
+def _life_plans(errors):
+    phase = data.FOUNDATION_PHASES.get(LIFE_PHASE)
+    if phase is None:
+        errors.append(f"FOUNDATION_PHASES: missing {LIFE_PHASE!r}")
+        return {}
+    plans = {}
+    home_repair = {k: _exercises(v, f"HOME_REPAIR[{k!r}]", errors) for k, v in data.HOME_REPAIR.items()}
+    if REHAB_DAY not in home_repair:
+        errors.append(f"HOME_REPAIR: missing rehab block {REHAB_DAY!r}")
+    rehab = Plan("Emergency Rehab", "Rehab", home_repair.get(REHAB_DAY, ()))
+
+    for day in WEEKDAYS:
+        day_plan = phase["Routine"].get(day, REST_DAY)
+        where = f"{LIFE_PHASE} {day}"
+        cat = day_plan.get("Category", "Mobility")
+        for table, name in ((data.WARMUPS, "WARMUPS"), (data.COOLDOWNS, "COOLDOWNS")):
+            if cat not in table:
+                errors.append(f"{where}: Category {cat!r} missing from {name}")
+        warmup = _drills(data.WARMUPS.get(cat, ()))
+        cooldown = _drills(data.COOLDOWNS.get(cat, ()))
+        core = _exercises(day_plan.get("Core", []), f"{where} core", errors, required=("name", "sets"))
+        gym = Plan(day_plan["Focus"], day_plan["Type"], _exercises(day_plan["Exercises"], where, errors), core, warmup, cooldown, phase.get("Class", "repair"))
+        home = gym
+        if day_plan["Type"] == "Gym":
+            home_key = day_plan.get("Home_Map")
+            if home_key not in home_repair:
+                errors.append(f"{where}: Home_Map {home_key!r} missing from HOME_REPAIR")
+            home = gym._replace(focus=f"Home Repair: {gym.focus}", type="Home", exercises=home_repair.get(home_key, ()))
+        for is_home, plan in ((False, gym), (True, home)):
+            plans[("life", day, is_home, False)] = plan
+            plans[("life", day, is_home, True)] = rehab
+    return plans
+
+
+def course_weeks():
+    return tuple(range(1, data.COURSE_WEEKS + 1))
+
+
+def _progressed(exercises, offset, rules):
+    """Exercises for the offset-th week of a phase block (0 = as written in the pack)."""
+    scale = rules["scale"][min(offset, len(rules["scale"]) - 1)] if rules["scale"] else 1.0
+    extra = rules["extra_sets"][min(offset, len(rules["extra_sets"]) - 1)] if rules["extra_sets"] else 0
+    if scale == 1.0 and extra == 0:
+        return exercises
+    out = []
+    for ex in exercises:
+        if ex.rx is not None:
+            rx = progress(ex.rx, scale, extra)
+            ex = ex._replace(sets=format_sets(rx), rx=rx)
+        out.append(ex)
+    return tuple(out)
+
+
+def _course_plans(errors):
+    plans = {}
+    block = None
+    rules = data.COURSE_PROGRESSION
+    for week in course_weeks():
+        # A week without its own entry continues the latest phase block before it,
+        # with volumes progressed by COURSE_PROGRESSION for its week within the block
+        if week in data.COURSE_DATA:
+            block, block_start = data.COURSE_DATA[week], week
+        if block is None:
+            errors.append(f"COURSE_DATA: week {week} has no phase block at or before it")
+            continue
+        for day in COURSE_DAYS:
+            day_plan = block["Schedule"].get(day)
+            if day_plan is None:
+                errors.append(f"COURSE_DATA week {week}: missing {day!r}")
+                continue
+            exercises = _exercises(day_plan["Exercises"], f"COURSE_DATA week {week} {day}", errors)
+            exercises = _progressed(exercises, week - block_start, rules)
+            plans[("course", week, day)] = Plan(day_plan["Focus"], "Course", exercises, theme=block["Theme"], phase=block["Phase"])
+    return plans
+
+
+PROGRAMS = {  # program -> (compiler, content tables it reads)
+    "life": (_life_plans, ("WARMUPS", "COOLDOWNS", "HOME_REPAIR", "FOUNDATION_PHASES")),
+    "course": (_course_plans, ("COURSE_WEEKS", "COURSE_DATA", "COURSE_PROGRESSION")),
+}
+
+
+def compile_plans(program):
+    """Resolves every plan of `program` into one flat, read-only index.
+
+    Raises ValueError listing every dangling reference in its content packs.
+    """
+    errors = []
+    plans = PROGRAMS[program][0](errors)
+    if errors:
+        raise ValueError("Invalid plan data:\n - " + "\n - ".join(errors))
+    return plans
+
+
+_COMPILED = {}  # program -> (content version, plans)
+
+
+def get_plans(program):
+    """Compiled plans for `program`, built on first use and again only after its packs reload."""
+    version = data.version(*PROGRAMS[program][1])
+    compiled = _COMPILED.get(program)
+    if compiled is None or compiled[0] != version:
+        try:
+            compiled = (version, compile_plans(program))
+        except ValueError as e:
+            if compiled is None:
+                raise
+            # A reloaded pack with dangling references: warn once, keep the last good plans
+            warnings.warn(f"{program} plans not recompiled: {e}")
+            compiled = (version, compiled[1])
+        _COMPILED[program] = compiled
+    return compiled[1]
+
+
+def life_plan(day_name, is_home, override=False):
+    return get_plans("life")[("life", day_name, is_home, override)]
+
+
+def course_plan(week, day):
+    return get_plans("course")[("course", week, day)]
+
+
+# ==========================================
+# 4. SESSION LOAD
+# ==========================================
+class SessionLoad(NamedTuple):
+    reps: int  # total reps (per-side counts doubled; to-failure sets excluded)
+    seconds: int  # time under tension: timed sets plus reps x tempo
+
+
+_LOADS = {}  # program -> (compiled plans, {plan key: SessionLoad})
+
+
+def plan_loads(program):
+    """SessionLoad of every plan in `program`, computed in one vectorized pass per compile."""
+    plans = get_plans(program)
+    cached = _LOADS.get(program)
+    if cached is not None and cached[0] is plans:
+        return cached[1]
+    import numpy as np  # deferred: only the load summary needs it
+
+    keys = list(plans)
+    rows = [(i, ex.rx, ex.tempo) for i, key in enumerate(keys) for ex in plans[key].exercises + plans[key].core if ex.rx is not None]
+    idx = np.array([i for i, _, _ in rows], dtype=np.int64)
+    sets = np.array([rx.sets for _, rx, _ in rows], dtype=np.float64)
+    reps = np.array([rx.reps for _, rx, _ in rows], dtype=np.float64)
+    secs = np.array([rx.seconds for _, rx, _ in rows], dtype=np.float64)
+    sides = np.array([2 if rx.side else 1 for _, rx, _ in rows], dtype=np.float64)
+    tempo = np.array([rep_seconds(t) for _, _, t in rows], dtype=np.float64)
+    work = sets * sides
+    total_reps = np.bincount(idx, weights=work * reps, minlength=len(keys))
+    tut = np.bincount(idx, weights=work * (secs + reps * tempo), minlength=len(keys))
+    loads = {key: SessionLoad(int(r), int(t)) for key, r, t in zip(keys, total_reps.tolist(), tut.tolist())}
+    _LOADS[program] = (plans, loads)
+    return loads
+
+
+def course_load(week, day):
+    return plan_loads("course")[("course", week, day)]
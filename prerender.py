@@ -0,0 +1,217 @@
+# prerender.py
+# Static, read-only copy of every page the app can show, for serving from a CDN
+# next to the interactive app. Run: python prerender.py [--out site] [--workers N] [--force]
+#   life/<day>-<gym|home>[-injured].html   every weekday x location x injury override
+#   course/week-<w>-day-<d>.html           every week/day of the 12-week course
+#   bible/<slug>.html, bible/index.html    every entry of the Iron Bible catalog
+# Pages are rendered in a process pool with the app's own render.py fragments.
+# manifest.json records a hash of each page's inputs (its plan or entry plus the
+# template sources), so a rebuild only re-renders pages whose content changed.
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+
+import plans
+import render
+import search
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = "site"
+MANIFEST = "manifest.json"
+LOCATIONS = ("Gym", "Home")
+INJURED_NOTE = "🚨 INJURY: Gym Cancelled. Rehab Loaded."  # ai_coach's override message
+
+PAGE_CSS = """
+body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; max-width: 860px; margin: 0 auto; padding: 16px; line-height: 1.5; }
+nav { margin-bottom: 16px; font-size: 0.9em; }
+.grid td, .grid th { padding: 4px 10px; }
+"""
+
+
+# ==========================================
+# 1. PAGES
+# ==========================================
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", str(text).lower()).strip("-") or "page"
+
+
+def _page(title, body, depth):
+    home = "../" * depth + "index.html"
+    return (
+        "<!doctype html><html lang='en'><head><meta charset='utf-8'>"
+        "<meta name='viewport' content='width=device-width, initial-scale=1'>"
+        f"<title>{escape(title)} | Bulletproof Athlete</title>"
+        f"<style>{render.CSS}{PAGE_CSS}</style></head>"
+        f"<body><nav><a href='{home}'>🛡️ Bulletproof Athlete</a></nav><main>{body}</main></body></html>"
+    )
+
+
+def life_page(day, location, override, plan):
+    title = f"{day} · {location}" + (" · Injured" if override else "")
+    note = f"<p class='alt-text'>{escape(INJURED_NOTE)}</p>" if override else ""
+    body = f"<h2>📅 {escape(day)}</h2>{note}" + render.banner_html(plan.theme, plan.focus) + render.plan_html(plan, heading="🏋️ Routine")
+    return title, body
+
+
+def course_page(week, day, plan, load):
+    title = f"Week {week} - {day}"
+    body = (
+        render.banner_html(plan.theme, title, f"{plan.phase} | Focus: {plan.focus}", level=2)
+        + f"<p>📊 Volume: {load.reps} reps | ⏱️ Time under tension: ~{load.seconds / 60:.0f} min</p>"
+        + render.plan_html(plan)
+    )
+    return title, body
+
+
+def bible_page(entry):
+    return entry.name, render.bible_card_html(entry) + f"<p>Source: {escape(entry.source)}</p>"
+
+
+def bible_index_page(entries):
+    cards = "".join(f"<a href='{slug}.html'>{escape(e.name)}</a> · {escape(e.muscle)}<br>" for slug, e in entries)
+    return "📖 Exercise Encyclopedia", f"<h2>📖 Exercise Encyclopedia</h2><p>{len(entries)} exercises</p>{cards}"
+
+
+def index_page(life_days, course_weeks, course_days):
+    life = "".join(
+        f"<tr><td>{escape(day)}</td>" + "".join(
+            f"<td><a href='life/{_slug(day)}-{loc.lower()}.html'>{loc}</a> "
+            f"(<a href='life/{_slug(day)}-{loc.lower()}-injured.html'>injured</a>)</td>" for loc in LOCATIONS
+        ) + "</tr>" for day in life_days
+    )
+    course = "".join(
+        f"<tr><td>Week {w}</td>" + "".join(f"<td><a href='course/week-{w}-{_slug(d)}.html'>{escape(d)}</a></td>" for d in course_days) + "</tr>"
+        for w in course_weeks
+    )
+    body = (
+        "<h1>🛡️ Bulletproof Athlete</h1>"
+        f"<h2>Life Protocol</h2><table class='grid'>{life}</table>"
+        f"<h2>12-Week Transformation</h2><table class='grid'>{course}</table>"
+        "<h2><a href='bible/index.html'>📖 Iron Bible</a></h2>"
+    )
+    return "Programs", body
+
+
+PAGES = {  # kind -> builder(*args) -> (title, body)
+    "life": life_page,
+    "course": course_page,
+    "bible": bible_page,
+    "bible_index": bible_index_page,
+    "index": index_page,
+}
+
+
+def jobs():
+    """(relative path, kind, args) for every page; args are the records the page is built from."""
+    out = []
+    for day in plans.WEEKDAYS:
+        for location in LOCATIONS:
+            for override in (False, True):
+                path = f"life/{_slug(day)}-{location.lower()}{'-injured' if override else ''}.html"
+                out.append((path, "life", (day, location, override, plans.life_plan(day, location == "Home", override))))
+    for week in plans.course_weeks():
+        for day in plans.COURSE_DAYS:
+            out.append((f"course/week-{week}-{_slug(day)}.html", "course", (week, day, plans.course_plan(week, day), plans.course_load(week, day))))
+    entries, taken = [], set()
+    for entry in sorted(search.catalog(), key=lambda e: e.name.lower()):
+        slug, n = _slug(entry.name), 2
+        while slug in taken:  # "Squat (Goblet)" and "Squat Goblet" get distinct pages
+            slug, n = f"{_slug(entry.name)}-{n}", n + 1
+        taken.add(slug)
+        entries.append((slug, entry))
+        out.append((f"bible/{slug}.html", "bible", (entry,)))
+    out.append(("bible/index.html", "bible_index", (tuple(entries),)))
+    out.append(("index.html", "index", (plans.WEEKDAYS, plans.course_weeks(), plans.COURSE_DAYS)))
+    return out
+
+
+# ==========================================
+# 2. BUILD
+# ==========================================
+def template_version():
+    """Hash of the code that shapes a page; editing it re-renders everything."""
+    h = hashlib.sha256()
+    for name in ("render.py", "prerender.py"):
+        with open(os.path.join(HERE, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def page_hash(kind, args, template):
+    # Records are NamedTuples of str/int/float/bool, so repr() is a stable serialization
+    return hashlib.sha256(f"{template}\0{kind}\0{args!r}".encode("utf-8")).hexdigest()[:16]
+
+
+def render_page(out_dir, path, kind, args):
+    """Worker: builds one page and writes it atomically. Returns its path."""
+    title, body = PAGES[kind](*args)
+    target = os.path.join(out_dir, path)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = target + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(_page(title, body, path.count("/")))
+    os.replace(tmp, target)
+    return path
+
+
+def _render_star(job):
+    return render_page(*job)
+
+
+def build(out_dir=OUT_DIR, workers=None, force=False):
+    """Renders every changed page into out_dir; returns (rendered, unchanged, removed) page counts."""
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            old = json.load(f)
+    except (FileNotFoundError, ValueError):
+        old = {}
+    template = template_version()
+    pages, todo = {}, []
+    for path, kind, args in jobs():
+        pages[path] = page_hash(kind, args, template)
+        if force or old.get(path) != pages[path] or not os.path.exists(os.path.join(out_dir, path)):
+            todo.append((out_dir, path, kind, args))
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_render_star, todo, chunksize=max(1, len(todo) // (workers * 4))))
+    else:
+        for job in todo:
+            _render_star(job)
+
+    removed = [path for path in old if path not in pages]
+    for path in removed:  # pages of exercises / days that no longer exist
+        try:
+            os.remove(os.path.join(out_dir, path))
+        except FileNotFoundError:
+            pass
+    os.makedirs(out_dir, exist_ok=True)
+    tmp = manifest_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(pages, f, indent=0, sort_keys=True)
+    os.replace(tmp, manifest_path)
+    return len(todo), len(pages) - len(todo), len(removed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render every program day and Bible entry to static HTML.")
+    parser.add_argument("--out", default=OUT_DIR, help="output directory (default: %(default)s)")
+    parser.add_argument("--workers", type=int, help="render processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="re-render every page, ignoring the manifest")
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    rendered, unchanged, removed = build(args.out, args.workers, args.force)
+    print(f"prerender: {rendered} rendered, {unchanged} unchanged, {removed} removed in {(time.perf_counter() - t0) * 1000:.0f} ms -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# render.py
+from functools import lru_cache
+from html import escape
+from urllib.parse import quote_plus
+
+# HTML for plans and Bible cards. Records from plans.py / search.py are
+# immutable and hashable, so every fragment is memoized per process and a
+# rerun only joins cached strings into one st.markdown payload. The same
+# fragments (and CSS) build the static pages of prerender.py.
+
+BIBLE_PAGE_SIZE = 12
+
+CSS = """
+.banner { padding: 20px; border-radius: 12px; color: white; margin-bottom: 25px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+/* Life Protocol Colors */
+.repair { background: linear-gradient(135deg, #F57C00, #E65100); }
+.recovery { background: linear-gradient(135deg, #607D8B, #455A64); }
+/* 12-Week Course Colors */
+.phase1 { background: linear-gradient(135deg, #FF9800, #F57C00); } /* Orange - Stability */
+.phase2 { background: linear-gradient(135deg, #4CAF50, #2E7D32); } /* Green - Strength */
+.phase3 { background: linear-gradient(135deg, #2196F3, #1565C0); } /* Blue - Power */
+
+.alt-text { color: #d32f2f !important; font-size: 0.9em; font-weight: bold; display: block; margin-top: 5px; }
+.tempo-tag { background-color: #e3f2fd; color: #1565c0 !important; padding: 2px 8px; border-radius: 4px; font-size: 0.85em; font-weight: bold; }
+
+/* Bible Card */
+.bible-card { background-color: #f1f8e9; color: #1a1a1a !important; padding: 15px; border-radius: 10px; border-left: 5px solid #558b2f; margin-bottom: 10px; }
+.bible-card h4 { color: #2e7d32 !important; margin: 0 0 5px 0; }
+.bible-card p { color: #1a1a1a !important; margin: 5px 0; }
+
+/* Core Box */
+.core-box { background-color: #e9ecef; color: #1a1a1a !important; border-left: 5px solid #343a40; padding: 15px; border-radius: 0 8px 8px 0; margin-top: 20px; }
+.core-box h4 { color: #1a1a1a !important; margin: 0 0 10px 0; }
+
+/* Routine Rows */
+.ex-row { display: flex; flex-wrap: wrap; gap: 10px; padding: 10px 0; border-bottom: 1px solid rgba(128,128,128,0.3); }
+.ex-main { flex: 3 1 240px; }
+.ex-meta { flex: 2 1 180px; }
+.ex-note { font-size: 0.85em; opacity: 0.7; margin-top: 4px; }
+
+/* Data Tables (History, Perf panel) */
+.data-table { width: 100%; border-collapse: collapse; }
+.data-table th, .data-table td { text-align: left; padding: 6px 10px; border-bottom: 1px solid rgba(128,128,128,0.3); }
+a { text-decoration: none; font-weight: bold; color: #0288D1 !important; }
+"""
+
+
+def get_youtube_link(name):
+    clean_name = name.split("(")[0].strip()
+    return "https://www.youtube.com/results?search_query=" + quote_plus(f"{clean_name} exercise form")
+
+
+def banner_html(theme, title, subtitle="", level=3):
+    sub = f"<p>{escape(subtitle)}</p>" if subtitle else ""
+    return f"<div class='banner {theme}'><h{level}>{escape(title)}</h{level}>{sub}</div>"
+
+
+@lru_cache(maxsize=4096)
+def exercise_html(i, ex, show_alt):
+    alt = f"<span class='alt-text'>Gym Busy? {escape(ex.alt)}</span>" if show_alt and ex.alt != "-" else ""
+    note = f"<div class='ex-note'>💡 {escape(ex.note)}</div>" if ex.note else ""
+    return (
+        "<div class='ex-row'>"
+        f"<div class='ex-main'><strong>{i + 1}. {escape(ex.name)}</strong> "
+        f"<a href='{escape(get_youtube_link(ex.name))}' target='_blank'>[📺 Demo]</a>{alt}</div>"
+        f"<div class='ex-meta'><strong>Sets:</strong> {escape(ex.sets)} | <strong>Tempo:</strong> "
+        f"<span class='tempo-tag'>{escape(ex.tempo)}</span>{note}</div>"
+        "</div>"
+    )
+
+
+@lru_cache(maxsize=512)
+def routine_html(exercises, show_alt=False):
+    """Whole routine as one payload (exercises is a tuple of plans.Exercise)."""
+    return "".join(exercise_html(i, ex, show_alt) for i, ex in enumerate(exercises))
+
+
+@lru_cache(maxsize=512)
+def item_list_html(items, detail="time", box_title=None):
+    """Bulleted warmup / core / cooldown list; core gets the boxed finisher style."""
+    rows = "".join(f"<li><strong>{escape(it.name)}</strong> ({escape(getattr(it, detail))})</li>" for it in items)
+    if box_title:
+        return f"<div class='core-box'><h4>{box_title}</h4><ul>{rows}</ul></div>"
+    return f"<ul class='item-list'>{rows}</ul>"
+
+
+def plan_html(plan, heading=None):
+    """Whole plan (warmup, routine, core, cooldown) as one read-only payload, in the app's order."""
+    parts = []
+    if plan.warmup:
+        parts.append("<h3>🔥 Warmup</h3>" + item_list_html(plan.warmup))
+    if heading:
+        parts.append(f"<h3>{escape(heading)}</h3>")
+    parts.append(routine_html(plan.exercises, plan.type == "Gym"))
+    if plan.core:
+        parts.append(item_list_html(plan.core, "sets", "🧱 Core Finisher"))
+    if plan.cooldown:
+        parts.append("<h3>❄️ Cooldown</h3>" + item_list_html(plan.cooldown))
+    return "".join(parts)
+
+
+def item_labels(items, detail="time"):
+    return [f"{it.name} ({getattr(it, detail)})" for it in items]
+
+
+def exercise_labels(exercises):
+    return [f"{i + 1}. {ex.name}" for i, ex in enumerate(exercises)]
+
+
+@lru_cache(maxsize=8192)
+def bible_card_html(entry):
+    return (
+        "<div class='bible-card'>"
+        f"<h4>{escape(entry.name)}</h4>"
+        f"<p><strong>Muscle:</strong> {escape(entry.muscle)} | <strong>Stretch:</strong> {escape(entry.stretch)}</p>"
+        f"<p><em>\"{escape(entry.cue)}\"</em></p>"
+        f"<a href='{escape(get_youtube_link(entry.name))}' target='_blank'>📺 Demo</a>"
+        "</div>"
+    )
+
+
+def bible_page(entries, page, page_size=BIBLE_PAGE_SIZE):
+    """(html, page_count) for one page of search results; page is 1-based."""
+    pages = max(1, -(-len(entries) // page_size))
+    page = min(max(page, 1), pages)
+    start = (page - 1) * page_size
+    return "".join(bible_card_html(e) for e in entries[start:start + page_size]), pages
+
+
+def table_html(columns, rows):
+    head = "".join(f"<th>{escape(c)}</th>" for c in columns)
+    body = "".join("<tr>" + "".join(f"<td>{escape(str(v))}</td>" for v in row) + "</tr>" for row in rows)
+    return f"<table class='data-table'><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
@@ -0,0 +1,162 @@
+# search.py
+import bisect
+import re
+import warnings
+from collections import defaultdict
+from typing import NamedTuple
+
+import data
+
+# ==========================================
+# 1. CATALOG
+# ==========================================
+class Entry(NamedTuple):
+    name: str
+    muscle: str = "-"
+    stretch: str = "-"
+    cue: str = ""
+    source: str = "Bible"
+
+
+FIELDS = ("name", "muscle", "stretch", "cue", "source")
+FIELD_WEIGHTS = {"name": 4.0, "muscle": 2.0, "stretch": 1.0, "cue": 1.0, "source": 0.5}
+PREFIX_FACTOR = 0.6  # "squ" -> "squat" while typing
+FUZZY_FACTOR = 0.4  # "adductr" -> "adductors"
+FUZZY_MIN_SIMILARITY = 0.3  # trigram Jaccard needed to count as a typo
+MIN_PREFIX = 2
+
+
+def catalog():
+    """Every exercise named anywhere in data.py; Bible entries win on duplicate names."""
+    entries = {}
+
+    def add(entry):
+        entries.setdefault(entry.name.lower(), entry)
+
+    for name, e in data.EXERCISE_BIBLE.items():
+        add(Entry(name, e["Muscle"], e["Stretch"], e["Cue"], "Bible"))
+    for phase in data.FOUNDATION_PHASES.values():
+        for day in phase["Routine"].values():
+            for ex in day["Exercises"] + day.get("Core", []):
+                add(Entry(ex["name"], cue=ex.get("note", ""), source="Life Protocol"))
+    for exercises in data.HOME_REPAIR.values():
+        for ex in exercises:
+            add(Entry(ex["name"], cue=ex.get("note", ""), source="Home Repair"))
+    for block in data.COURSE_DATA.values():
+        for day in block["Schedule"].values():
+            for ex in day["Exercises"]:
+                add(Entry(ex["name"], cue=ex.get("note", ""), source="12-Week"))
+    for table, source in ((data.WARMUPS, "Warmup"), (data.COOLDOWNS, "Cooldown")):
+        for drills in table.values():
+            for d in drills:
+                add(Entry(d["name"], d.get("target", "-"), cue=d.get("note", ""), source=source))
+    return list(entries.values())
+
+
+def tokenize(text):
+    return re.findall(r"[a-z0-9]+", str(text).lower())
+
+
+def trigrams(token):
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# ==========================================
+# 2. INVERTED INDEX
+# ==========================================
+class SearchIndex:
+    """Token postings per field, a sorted vocabulary for prefixes and a trigram map for typos.
+
+    Query syntax: plain words search every field, `field:word` (name, muscle,
+    stretch, cue, source) scopes a word. Every word must match (words shorter
+    than MIN_PREFIX that are not in the vocabulary are ignored); results are
+    ranked by field weight and match quality (exact > prefix > fuzzy).
+    """
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.postings = {f: defaultdict(set) for f in FIELDS}  # field -> token -> doc ids
+        for doc, entry in enumerate(self.entries):
+            for field in FIELDS:
+                for token in tokenize(getattr(entry, field)):
+                    self.postings[field][token].add(doc)
+        self.vocab_set = {t for f in FIELDS for t in self.postings[f]}
+        self.vocab = sorted(self.vocab_set)
+        self.grams = defaultdict(set)  # trigram -> vocabulary tokens
+        for token in self.vocab:
+            for gram in trigrams(token):
+                self.grams[gram].add(token)
+
+    def _expand(self, term):
+        """Vocabulary tokens matching `term`, with a match-quality factor."""
+        matches = {}
+        if len(term) >= MIN_PREFIX:
+            i = bisect.bisect_left(self.vocab, term)
+            while i < len(self.vocab) and self.vocab[i].startswith(term):
+                matches[self.vocab[i]] = PREFIX_FACTOR
+                i += 1
+        if term in self.vocab_set:  # exact hits count at any length ("s" in "Child's Pose")
+            matches[term] = 1.0
+        if not matches and len(term) >= 3:
+            grams = trigrams(term)
+            overlap = defaultdict(int)
+            for gram in grams:
+                for token in self.grams.get(gram, ()):
+                    overlap[token] += 1
+            for token, shared in overlap.items():
+                similarity = shared / (len(grams) + len(trigrams(token)) - shared)
+                if similarity >= FUZZY_MIN_SIMILARITY:
+                    matches[token] = FUZZY_FACTOR * similarity
+        return matches
+
+    def _score_term(self, term, fields):
+        scores = defaultdict(float)
+        for token, quality in self._expand(term).items():
+            for field in fields:
+                for doc in self.postings[field].get(token, ()):
+                    score = FIELD_WEIGHTS[field] * quality
+                    if score > scores[doc]:
+                        scores[doc] = score
+        return scores
+
+    def search(self, query, limit=None):
+        """Ranked entries for `query`; an empty query returns the whole catalog."""
+        total = None
+        for raw in query.split():
+            field, _, value = raw.lower().rpartition(":")
+            fields, text = ((field,), value) if field in FIELDS else (FIELDS, raw)
+            for term in tokenize(text):
+                if len(term) < MIN_PREFIX and term not in self.vocab_set:
+                    continue  # a too-short fragment that matches nothing narrows nothing
+                scores = self._score_term(term, fields)
+                if total is None:
+                    total = dict(scores)
+                else:
+                    total = {doc: s + scores[doc] for doc, s in total.items() if doc in scores}
+                if not total:
+                    return []
+        if total is None:
+            return self.entries[:limit] if limit else list(self.entries)
+        ranked = sorted(total, key=lambda doc: (-total[doc], self.entries[doc].name))
+        return [self.entries[doc] for doc in ranked[:limit]]
+
+
+CATALOG_TABLES = ("EXERCISE_BIBLE", "FOUNDATION_PHASES", "HOME_REPAIR", "COURSE_DATA", "WARMUPS", "COOLDOWNS")
+_INDEX = (None, None)  # (content version, index)
+
+
+def get_index():
+    """The catalog index, shared by every session; rebuilt only when a content pack reloads."""
+    global _INDEX
+    version = data.version(*CATALOG_TABLES)
+    if _INDEX[0] != version:
+        try:
+            _INDEX = (version, SearchIndex(catalog()))
+        except ValueError as e:
+            if _INDEX[1] is None:
+                raise
+            # Warn once for this content version, keep serving the last good index
+            warnings.warn(f"search index not rebuilt: {e}")
+            _INDEX = (version, _INDEX[1])
+    return _INDEX[1]
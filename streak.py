@@ -0,0 +1,112 @@
+# streak.py
+import bisect
+import datetime
+import re
+
+# History keys come in two shapes: calendar days ("2024-05-01", Life Protocol)
+# and course progress ("Week 3 Day 2", 12-Week mode). Only calendar days count
+# towards a streak; course keys are tracked as progress.
+COURSE_KEY = re.compile(r"^Week (\d+) (Day \d+)$")
+EPOCH = datetime.date(1970, 1, 1)
+
+
+def parse_key(key):
+    """Returns ("day", epoch_day), ("course", (week, day)) or None for unknown keys."""
+    key = str(key)
+    m = COURSE_KEY.match(key)
+    if m:
+        return "course", (int(m.group(1)), m.group(2))
+    try:
+        return "day", (datetime.date.fromisoformat(key[:10]) - EPOCH).days
+    except ValueError:
+        return None
+
+
+def epoch_days(keys):
+    """Epoch days (int64 array) of ISO date keys; anything unparseable is dropped."""
+    import numpy as np  # only needed for full rebuilds, kept off the cold-start path
+
+    keys = [k[:10] for k in keys]
+    try:
+        # One C-level parse for the common case of clean ISO dates
+        days = np.array(keys, dtype="datetime64[D]")
+        return days[~np.isnat(days)].astype(np.int64)
+    except ValueError:
+        return np.array([p[1] for p in map(parse_key, keys) if p is not None and p[0] == "day"], dtype=np.int64)
+
+
+def runs_from_days(days):
+    """Vectorized rebuild: (starts, ends) of consecutive-day runs, as int64 arrays."""
+    import numpy as np
+    days = np.sort(np.asarray(days, dtype=np.int64))
+    if not days.size:
+        return days, days
+    days = days[np.concatenate(([True], days[1:] != days[:-1]))]  # sorted unique, no hashing
+    breaks = np.flatnonzero(np.diff(days) != 1)
+    starts = np.concatenate((days[:1], days[breaks + 1]))
+    ends = np.concatenate((days[breaks], days[-1:]))
+    return starts, ends
+
+
+class StreakTracker:
+    """Current/longest streak over logged days, kept as a set of disjoint runs.
+
+    add() merges a day into its neighbouring runs in O(log n); rebuild() recomputes
+    every run with NumPy in one pass.
+    """
+
+    def __init__(self, keys=()):
+        self.rebuild(keys)
+
+    def rebuild(self, keys):
+        keys = list(map(str, keys))
+        matches = [COURSE_KEY.match(k) for k in keys if k.startswith("Week ")]
+        self.course_logged = {(int(m.group(1)), m.group(2)) for m in matches if m}
+        days = [k for k in keys if not k.startswith("Week ")] if matches else keys
+        self._starts, self._end, self._start_of, self.longest = [], {}, {}, 0
+        if not days:
+            return
+        starts, ends = runs_from_days(epoch_days(days))
+        if starts.size:
+            self._starts = starts.tolist()  # sorted run starts
+            self._end = dict(zip(self._starts, ends.tolist()))  # start -> end
+            self._start_of = {e: s for s, e in self._end.items()}  # end -> start
+            self.longest = int((ends - starts).max() + 1)
+
+    def runs(self):
+        """[(start, end)] epoch-day runs, oldest first."""
+        return [(s, self._end[s]) for s in self._starts]
+
+    def _run_at(self, day):
+        i = bisect.bisect_right(self._starts, day) - 1
+        if i >= 0 and self._end[self._starts[i]] >= day:
+            return self._starts[i]
+        return None
+
+    def add(self, key):
+        parsed = parse_key(key)
+        if parsed is None:
+            return
+        if parsed[0] == "course":
+            self.course_logged.add(parsed[1])
+            return
+        day = parsed[1]
+        if self._run_at(day) is not None:
+            return
+        start = self._start_of.pop(day - 1, day)
+        end = day
+        if day + 1 in self._end:
+            end = self._end.pop(day + 1)
+            del self._starts[bisect.bisect_left(self._starts, day + 1)]
+        if start == day:
+            bisect.insort(self._starts, day)
+        self._end[start] = end
+        self._start_of[end] = start
+        self.longest = max(self.longest, end - start + 1)
+
+    def current(self, today=None):
+        """Consecutive days ending today, or yesterday if today is not logged yet."""
+        today = (today or datetime.date.today()) - EPOCH
+        anchor = today.days if self._run_at(today.days) is not None else today.days - 1
+        start = self._run_at(anchor)
+        return 0 if start is None else anchor - start + 1
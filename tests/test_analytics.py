@@ -0,0 +1,33 @@
+import datetime
+import random
+
+from analytics import Rollups, week_start
+from streak import EPOCH
+
+
+def test_week_start_is_monday():
+    monday = datetime.date(2024, 5, 6)
+    for offset in range(7):
+        day = ((monday + datetime.timedelta(days=offset)) - EPOCH).days
+        assert EPOCH + datetime.timedelta(days=week_start(day)) == monday
+
+
+def test_rebuild_matches_incremental_updates():
+    rng = random.Random(3)
+    rows = {}
+    incremental = Rollups()
+    for _ in range(400):
+        if rng.random() < 0.2:
+            key = f"Week {rng.randint(1, 12)} Day {rng.randint(1, 3)}"
+        else:
+            key = (datetime.date(2024, 1, 1) + datetime.timedelta(days=rng.randrange(120))).isoformat()
+        row = (rng.choice(["Life", "Phase 1"]), rng.choice(["Good", "Tired"]), rng.choice(["Yes", "No"]))
+        incremental.update(key, rows.get(key), row)
+        rows[key] = row
+    rebuilt = Rollups(rows)
+    assert rebuilt.dates == incremental.dates
+    assert {w: n for w, n in incremental.weekly.items() if n} == rebuilt.weekly
+    assert +incremental.moods == rebuilt.moods
+    assert +incremental.course == rebuilt.course
+    today = datetime.date(2024, 4, 30)
+    assert rebuilt.weekly_adherence(today=today) == incremental.weekly_adherence(today=today)
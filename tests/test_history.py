@@ -0,0 +1,105 @@
+import datetime
+import io
+import multiprocessing
+import os
+
+import pytest
+
+import history
+
+ROW = ("Life", "Neutral", "Yes")
+
+
+def day(n):
+    return (datetime.date(2024, 1, 1) + datetime.timedelta(days=n)).isoformat()
+
+
+def test_journal_replays_on_load(tmp_path):
+    path = str(tmp_path / "h.csv")
+    store = history.HistoryStore(path)
+    store.upsert(day(0), *ROW)
+    store.upsert(day(1), *ROW)
+    store.upsert(day(0), "Life", "Tired", "No")  # last write for a Date wins
+    assert not os.path.exists(path)  # nothing compacted yet: all in the journal
+    assert history.HistoryStore(path).rows == {day(0): ("Life", "Tired", "No"), day(1): ROW}
+
+
+def test_torn_journal_tail_is_trimmed_before_append(tmp_path):
+    path = str(tmp_path / "h.csv")
+    history.HistoryStore(path).upsert(day(0), *ROW)
+    with open(path + ".journal", "ab") as f:
+        f.write(b"2024-01-05,Life,Neu")  # crash mid-append
+    store = history.HistoryStore(path)
+    assert list(store.rows) == [day(0)]
+    store.upsert(day(1), *ROW)
+    with open(path + ".journal", "rb") as f:
+        assert f.read().splitlines() == [b"2024-01-01,Life,Neutral,Yes", b"2024-01-02,Life,Neutral,Yes"]
+    assert list(history.HistoryStore(path).rows) == [day(0), day(1)]
+
+
+def test_legacy_csv_migrates_on_compaction(tmp_path):
+    path = str(tmp_path / "h.csv")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Date,Phase,Mood,Completed\n2023-12-31,Phase 1,Good,Yes\n")
+    store = history.HistoryStore(path)
+    assert store.rows == {"2023-12-31": ("Phase 1", "Good", "Yes")}
+    store.upsert(day(0), *ROW)
+    store.compact()
+    assert not os.path.exists(path + ".journal") and not os.path.exists(path + ".compacting")
+    with open(path, encoding="utf-8") as f:
+        assert f.read().splitlines() == ["Date,Phase,Mood,Completed", "2023-12-31,Phase 1,Good,Yes", "2024-01-01,Life,Neutral,Yes"]
+
+
+def _log_days(path, first, count):
+    history.COMPACT_EVERY = 7  # compact constantly, racing the other workers
+    store = history.HistoryStore(path)
+    for n in range(first, first + count):
+        store.upsert(day(n), *ROW)
+        if n % 50 == 0:
+            store.compact()
+    store.wait()
+
+
+def test_concurrent_processes_with_compaction_keep_every_row(tmp_path):
+    path = str(tmp_path / "h.csv")
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_log_days, args=(path, i * 300, 300)) for i in range(4)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+        assert w.exitcode == 0
+    store = history.HistoryStore(path)
+    assert len(store.rows) == 1200
+    store.compact()
+    assert len(history.HistoryStore(path).rows) == 1200
+
+
+def test_athlete_slug_keeps_names_apart():
+    assert history.athlete_slug("  ") == history.athlete_slug("default") == "default"
+    assert history.athlete_slug("Jane Doe") == history.athlete_slug(" jane  DOE ")
+    slugs = {history.athlete_slug(n) for n in ("Иван Петров", "Иван", "José", "Jos", "Jose\u0301x", "!!!")}
+    assert len(slugs) == 6 and "default" not in slugs
+    assert history.athlete_slug("Иван Петров").startswith("иван-петров-")
+    assert history.athlete_slug("José") == history.athlete_slug("Jose\u0301")  # NFKC
+
+
+def test_athlete_path_keeps_legacy_partitions(tmp_path):
+    directory = str(tmp_path)
+    (tmp_path / "jane-doe.csv").write_text("Date,Phase,Mood,Completed\n")
+    (tmp_path / "jos.csv").write_text("Date,Phase,Mood,Completed\n")
+    assert history.athlete_path(directory, "Jane Doe") == os.path.join(directory, "jane-doe.csv")
+    # "José" used to collide with "Jos" in jos.csv: it gets its own file now
+    assert history.athlete_path(directory, "José") == os.path.join(directory, history.athlete_slug("José") + ".csv")
+    assert history.athlete_path(directory, "Mia") == os.path.join(directory, history.athlete_slug("Mia") + ".csv")
+
+
+def test_malformed_import_keeps_earlier_chunks(tmp_path):
+    store = history.HistoryStore(str(tmp_path / "h.csv"))
+    data = "Date,Phase,Mood,Completed\n2024-01-01,Life,Good,Yes\n2024-01-02,Life,Good,Yes\n"
+    data += "2024-01-03," + "x" * 200_000 + ",Good,Yes\n"  # over csv.field_size_limit()
+    with pytest.raises(history.ImportFailed) as failed:
+        history.import_history(store, io.BytesIO(data.encode()), chunk=2)
+    assert failed.value.report.imported == 2
+    assert sorted(store.rows) == [day(0), day(1)]
+    assert store.streaks.longest == 2
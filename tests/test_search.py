@@ -0,0 +1,17 @@
+import pytest
+
+import search
+
+
+@pytest.mark.parametrize("name", ["Child's Pose", "World's Greatest Stretch", "Prone W-Raise", "1.5 Rep Squats"])
+def test_exact_names_with_short_words_are_found(name):
+    assert search.get_index().search(name)[0].name == name
+
+
+def test_short_word_matching_nothing_is_ignored():
+    index = search.get_index()
+    assert [e.name for e in index.search("squat q")] == [e.name for e in index.search("squat")]
+
+
+def test_every_word_must_match():
+    assert search.get_index().search("squat zzzzzz") == []
@@ -0,0 +1,68 @@
+import datetime
+import random
+
+from streak import EPOCH, StreakTracker, runs_from_days
+
+
+def day(n):
+    """ISO key of epoch day `n`."""
+    return (EPOCH + datetime.timedelta(days=n)).isoformat()
+
+
+def test_add_merges_adjacent_runs():
+    t = StreakTracker([day(10), day(12)])
+    assert t.runs() == [(10, 10), (12, 12)]
+    t.add(day(11))  # bridges both neighbours into one run
+    assert t.runs() == [(10, 12)]
+    assert t.longest == 3
+    t.add(day(9))
+    t.add(day(13))
+    assert t.runs() == [(9, 13)]
+    t.add(day(11))  # already logged: no change
+    assert t.runs() == [(9, 13)]
+    assert t.longest == 5
+
+
+def test_current_counts_from_today_or_yesterday():
+    today = datetime.date(2024, 5, 10)
+    yesterday = today - datetime.timedelta(days=1)
+    t = StreakTracker([(yesterday - datetime.timedelta(days=i)).isoformat() for i in range(3)])
+    assert t.current(today) == 3  # today not logged yet, streak still alive
+    t.add(today.isoformat())
+    assert t.current(today) == 4
+    assert t.current(today + datetime.timedelta(days=2)) == 0  # a missed day breaks it
+
+
+def test_course_keys_excluded():
+    t = StreakTracker(["Week 1 Day 1", "Week 1 Day 2", day(100)])
+    assert t.runs() == [(100, 100)]
+    t.add("Week 2 Day 1")
+    t.add("not a date")
+    assert t.runs() == [(100, 100)]
+    assert t.longest == 1
+    assert t.course_logged == {(1, "Day 1"), (1, "Day 2"), (2, "Day 1")}
+
+
+def test_runs_from_days_unsorted_with_duplicates():
+    starts, ends = runs_from_days([5, 3, 4, 4, 9, 10, 3, 20])
+    assert list(zip(starts.tolist(), ends.tolist())) == [(3, 5), (9, 10), (20, 20)]
+
+
+def test_rebuild_without_calendar_days():
+    for keys in ([""], ["2024-13-45"], ["Week 1 Day 1", "NaT"]):
+        t = StreakTracker(keys)
+        assert t.runs() == [] and t.longest == 0 and t.current() == 0
+
+
+def test_rebuild_matches_incremental_adds():
+    rng = random.Random(7)
+    keys = [day(rng.randrange(19000, 19400)) for _ in range(500)] + ["Week 3 Day 2"]
+    incremental = StreakTracker()
+    for key in keys:
+        incremental.add(key)
+    rebuilt = StreakTracker(keys)
+    assert incremental.runs() == rebuilt.runs()
+    assert incremental.longest == rebuilt.longest
+    assert incremental.course_logged == rebuilt.course_logged
+    today = EPOCH + datetime.timedelta(days=19400)
+    assert incremental.current(today) == rebuilt.current(today)
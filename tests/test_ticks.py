@@ -0,0 +1,36 @@
+import multiprocessing
+
+import ticks
+
+
+def _tick(path, worker):
+    store = ticks.DailyTicks(path)  # each worker starts from its own in-memory copy
+    for i in range(25):
+        store.set("2024-05-01", f"w{worker}_{i}", True)
+
+
+def test_workers_keep_each_others_ticks(tmp_path):
+    path = str(tmp_path / "h.csv.ticks.json")
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_tick, args=(path, w)) for w in range(4)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+        assert w.exitcode == 0
+    assert len(ticks.DailyTicks(path).days["2024-05-01"]) == 100
+
+
+def test_get_sees_other_writers(tmp_path):
+    path = str(tmp_path / "t.json")
+    a, b = ticks.DailyTicks(path), ticks.DailyTicks(path)
+    assert a.get("2024-05-01", "squat", False) is False
+    b.set("2024-05-01", "squat", True)
+    assert a.get("2024-05-01", "squat") is True
+
+
+def test_only_recent_days_are_kept(tmp_path):
+    store = ticks.DailyTicks(str(tmp_path / "t.json"))
+    for d in range(1, 21):
+        store.set(f"2024-05-{d:02d}", "x", True)
+    assert sorted(store.days) == [f"2024-05-{d:02d}" for d in range(7, 21)]
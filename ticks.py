@@ -0,0 +1,81 @@
+# ticks.py
+import fcntl
+import json
+import os
+import threading
+
+import metrics
+
+# Per-day checklist state (exercise / supplement ticks) for one athlete, kept
+# in a small JSON file next to their history: {"2024-05-01": {key: value}}.
+# Only the most recent KEEP_DAYS days are kept so the file stays tiny.
+
+KEEP_DAYS = 14
+
+
+def _stat_sig(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class DailyTicks:
+    """Ticks for one file. Several worker processes may share it: reads pick up
+    their writes via a stat() check, and set() merges into the file under a flock."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._sig, self.days = None, {}
+        self.refresh()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def refresh(self):
+        """Reloads if the file changed since we last read or wrote it."""
+        sig = _stat_sig(self.path)
+        if sig != self._sig:
+            self._sig, self.days = sig, self._read()
+
+    def get(self, day, key, default=None):
+        self.refresh()
+        return self.days.get(day, {}).get(key, default)
+
+    def set(self, day, key, value):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)  # released by close()
+                days = self._read()  # other workers' ticks since we last looked
+                days.setdefault(day, {})[key] = value
+                for old in sorted(days)[:-KEEP_DAYS]:
+                    del days[old]
+                tmp = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(days, f)
+                    metrics.count("ticks.bytes_written", f.tell())
+                os.replace(tmp, self.path)
+                self._sig, self.days = _stat_sig(self.path), days
+            finally:
+                os.close(fd)
+
+
+_TICKS = {}
+_TICKS_LOCK = threading.Lock()
+
+
+def get_ticks(path):
+    """Process-wide tick state for `path`, shared by every session."""
+    key = os.path.abspath(path)
+    with _TICKS_LOCK:
+        if key not in _TICKS:
+            _TICKS[key] = DailyTicks(key)
+        return _TICKS[key]